@@ -12,37 +12,54 @@ Following CLAUDE.md guidance for paywall handling and page load detection.
 
 import argparse
 import asyncio
-import glob
+import contextlib
+import copy
+import functools
+import hashlib
+import itertools
 import json
+import logging
 import os
 import random
 import re
 import sys
+import threading
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Iterator
 from datetime import datetime
+from io import BytesIO
 
 # from functools import partial  # Unused import removed
 from typing import Any
-from urllib.parse import urljoin, urlparse
-from xml.etree import ElementTree as ET
+from urllib.parse import urljoin, urlsplit
 
 import aiofiles
-import dateparser
+import aiohttp
 import dateutil.parser
 import markdown
 import requests
 import requests.exceptions
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from dotenv import load_dotenv
 from html_to_markdown import convert_to_markdown
+from lxml import etree
 from pydoll.browser.chromium import Chrome  # type: ignore
 from pydoll.browser.options import ChromiumOptions  # type: ignore
+from pydoll.commands import NetworkCommands  # type: ignore
 from pydoll.constants import Key  # type: ignore
 
 # Note: Resource blocking feature temporarily disabled - imports not available in current Pydoll version
 from tqdm.asyncio import tqdm
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # Optional speedup: pip install "substack2md[speedups]"
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
 # Load environment variables
 load_dotenv()
 
@@ -55,17 +72,311 @@ NUM_POSTS_TO_SCRAPE = int(os.getenv("NUM_POSTS_TO_SCRAPE", "0"))
 HEADLESS = os.getenv("HEADLESS", "false").lower() == "true"  # Default to non-headless for user intervention
 BROWSER_PATH = os.getenv("BROWSER_PATH", "")
 USER_AGENT = os.getenv("USER_AGENT", "")
+# Browser cookies of the last successful login, restored on later runs instead of logging in again
+SESSION_COOKIE_FILE = os.getenv(
+    "SESSION_COOKIE_FILE",
+    os.path.join(os.getenv("XDG_CONFIG_HOME") or os.path.expanduser("~/.config"), "pydoll-substack2md", "cookies.json"),
+)
+# Chrome profile kept between runs (cookies, HTTP cache, Cloudflare clearance); "" uses a throwaway profile
+BROWSER_PROFILE_DIR = os.getenv(
+    "BROWSER_PROFILE_DIR",
+    os.path.join(os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "pydoll-substack2md", "profile"),
+)
+# Seconds between page-state checks while waiting for a page; raise it on slow connections
+POLL_INTERVAL = float(os.getenv("PYDOLL_POLL_INTERVAL", "0.05"))
 
 # Directory configuration
 BASE_MD_DIR = "substack_md_files"
 BASE_HTML_DIR = "substack_html_pages"
 HTML_TEMPLATE = "author_template.html"
 JSON_DATA_DIR = "data"
+IMAGE_DOWNLOAD_CONCURRENCY = 8  # Images of a post downloaded at the same time
+IMAGE_DOWNLOAD_RETRIES = 3  # Attempts per image on 429 / 5xx responses
+IMAGE_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+IMAGE_RETRY_AFTER_MAX = 60  # Longest Retry-After (seconds) honored before retrying an image download
+PAYWALL_SKIP_TTL = 24 * 60 * 60  # Seconds a known-paywalled post is skipped without being fetched again
+SESSION_COOKIE_TTL = 14 * 24 * 60 * 60  # Saved login cookies older than this are ignored
+MANUAL_LOGIN_TIMEOUT = 10 * 60  # Seconds to wait for a manual login to be detected before carrying on
+
+# Requests the browser never makes: images (post images are downloaded separately from their src), fonts,
+# media and trackers only slow down page loads. Scripts and stylesheets stay, Substack renders client-side
+_BLOCKED_URL_PATTERNS = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.svg",
+    "*.mp4",
+    "*.webm",
+    "*.mp3",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*substackcdn.com/image/*",
+    "*fonts.googleapis.com*",
+    "*fonts.gstatic.com*",
+    "*googletagmanager.com*",
+    "*google-analytics.com*",
+    "*doubleclick.net*",
+    "*connect.facebook.net*",
+]
+# Fields of a saved Network.Cookie that Storage.setCookies accepts back
+_COOKIE_PARAM_KEYS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite")
+_SITEMAP_LOC_TAG = "{http://www.sitemaps.org/schemas/sitemap/0.9}loc"
+
+# Fast-path date formats (ISO "2024-01-15..." and "Jan 15, 2024"); anything else falls back to dateparser
+_ISO_DATE_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})")
+_MDY_DATE_RE = re.compile(r"^([A-Z][a-z]{2})[a-z]*\.?\s+(\d{1,2}),?\s+(\d{4})")
+_MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+_DATEPARSER_SETTINGS: Any = {"PREFER_DAY_OF_MONTH": "first"}
+# Byline separators between author names and the date
+_DATE_PART_SEP_RE = re.compile(r"[∙·•|]")
+_DIGIT_RE = re.compile(r"\d")
+# Whole month names or abbreviations, so names like "Jane" or "Mark" in a byline don't pass for dates
+_MONTH_RE = re.compile(
+    r"\b(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|June?|July?|Aug(?:ust)?|Sept?(?:ember)?"
+    r"|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\b"
+)
+# Where Substack pages put the post date, most specific first
+_DATE_SELECTORS = [
+    # Very specific selector for the date div in byline-wrapper
+    # Target the date-containing div that has classes like 'color-pub-secondary-text-*'
+    "div.byline-wrapper div[class*='color-pub-secondary-text'] > div",
+    # More specific: the innermost div that contains the date text
+    "div.byline-wrapper div.pencraft.pc-display-flex.pc-gap-4 div[class*='color-pub-secondary-text']",
+    # Even more specific: look for div with date-like classes
+    "div[class*='date'][class*='pub-secondary']",
+    # Time elements with datetime attribute
+    "time[datetime]",  # Time elements with datetime
+    "article time[datetime]",  # Time in article with datetime
+    "div.post-header time[datetime]",  # Time in post header
+    # Text-based selectors as fallback
+    "span.post-meta-date",
+    "div.post-date",
+    "div.post-meta time",
+    "span[class*='date']",
+]
+# Filename cleanup for downloaded images
+_NON_WORD_RE = re.compile(r"[^\w\s-]")
+# Hex digits of the URL hash that ends every image filename
+_IMAGE_HASH_LEN = 8
+_DASH_RE = re.compile(r"[-\s]+")
+# Cheap pre-check so image-free HTML skips the parse/serialize round-trip
+_IMG_TAG_RE = re.compile(r"<img\b", re.IGNORECASE)
+_BODY_TAG_RE = re.compile(r"<body\b", re.IGNORECASE)
+
+# In-page probe: tags the first element matching any (name, css selector, text) probe and returns its name.
+# Text probes match an element's own text nodes, like Pydoll's find(text=...).
+_FIRST_MATCH_JS = """
+(() => {
+    const probes = %s;
+    for (const el of document.querySelectorAll("[data-substack2md-match]")) {
+        el.removeAttribute("data-substack2md-match");
+    }
+    for (const [name, selector, text] of probes) {
+        for (const el of document.querySelectorAll(selector)) {
+            if (!text || Array.from(el.childNodes).some((n) => n.nodeType === 3 && n.textContent.includes(text))) {
+                el.setAttribute("data-substack2md-match", name);
+                return name;
+            }
+        }
+    }
+    return null;
+})()
+"""
+# Tags the page's "Sign in" button: a native button whose text mentions "Sign in", else one linking to sign-in
+_SIGN_IN_BUTTON_JS = """
+(() => {
+    for (const el of document.querySelectorAll("[data-substack2md-match]")) {
+        el.removeAttribute("data-substack2md-match");
+    }
+    const buttons = Array.from(document.querySelectorAll("button"));
+    const button =
+        buttons.find((b) => b.getAttribute("native") === "true" && (b.textContent || "").includes("Sign in")) ||
+        buttons.find((b) => (b.getAttribute("data-href") || "").includes("sign-in"));
+    if (!button) return null;
+    button.setAttribute("data-substack2md-match", "sign_in");
+    return "sign_in";
+})()
+"""
+# In-page classifier for the sign-in form: one pass over inputs/buttons, keeping the best-ranked match per role
+# (lower rank wins, mirroring the old selector order). Tags each winner and returns the found roles.
+_LOGIN_FORM_JS = """
+(() => {
+    const best = {};
+    const consider = (role, rank, el) => {
+        if (!best[role] || rank < best[role].rank) best[role] = { rank, el };
+    };
+    for (const el of document.querySelectorAll("[data-substack2md-role]")) {
+        el.removeAttribute("data-substack2md-role");
+    }
+    for (const el of document.querySelectorAll("input, button")) {
+        const type = (el.getAttribute("type") || "").toLowerCase();
+        const name = el.getAttribute("name") || "";
+        const placeholder = el.getAttribute("placeholder") || "";
+        if (el.tagName === "INPUT") {
+            if (type === "email") consider("email", 0, el);
+            else if (name === "email") consider("email", 1, el);
+            else if (placeholder === "Email") consider("email", 2, el);
+            else if (type === "password") consider("password", 0, el);
+            else if (name === "password") consider("password", 1, el);
+            else if (placeholder === "Password") consider("password", 2, el);
+            else if (el.classList.contains("input-ZGrgg4")) consider("email", 3, el);
+        } else {
+            const text = el.textContent || "";
+            if (type === "submit") consider("submit", 0, el);
+            else if (text.includes("Continue")) consider("submit", 1, el);
+            else if (text.includes("Sign in")) consider("submit", 2, el);
+            else if (el.classList.contains("buttonBase-GK1x3M")) consider("submit", 3, el);
+        }
+    }
+    for (const [role, match] of Object.entries(best)) {
+        match.el.setAttribute("data-substack2md-role", role);
+    }
+    return Object.keys(best).join(",");
+})()
+"""
+# Summary of the page's links for login debugging, serialized to JSON (execute_script only returns primitives)
+_LINKS_DEBUG_JS = """
+(() => {
+    const links = Array.from(document.querySelectorAll("a"));
+    const first = links.slice(0, 5).map((a) => ({
+        text: a.textContent,
+        href: a.getAttribute("href"),
+        class: a.getAttribute("class"),
+    }));
+    return JSON.stringify({ count: links.length, first });
+})()
+"""
+_PROBE_POLL_INTERVAL = 0.25
+# Presence checks on a page that has already loaded: DOM lookups take milliseconds, so an absent element is
+# known to be absent almost at once. Waits for content that is still arriving use their own, longer timeouts
+_PROBE_TIMEOUT = 0.3
+_MANUAL_LOGIN_POLL_INTERVAL = 0.5
+# Elements that only show up for a logged-in reader, as (name, css selector, text) probes for _find_first
+_LOGIN_INDICATOR_PROBES = [
+    ("user_menu", ".user-menu", ""),
+    ("avatar_button", "button.avatarButton-lZBlGB", ""),
+    ("dashboard_button", "*", "Dashboard"),
+    ("reader_nav", ".reader-nav-root", ""),
+    ("home_title", "h1", "Home"),
+    ("subscriber_elem", "[data-testid='subscriber-only']", ""),
+    ("signout_elem", "*", "Sign out"),
+]
+_WAIT_POLL_INTERVAL = POLL_INTERVAL
+# Samples of the post body size must be this far apart to count as "stopped changing"
+_STABILITY_POLL_INTERVAL = max(POLL_INTERVAL, 0.15)
+# Page-state conditions polled with _wait_for_js instead of fixed sleeps
+_ARTICLE_READY_JS = "document.readyState === 'complete' && !!document.querySelector('div.body.markup, article, main')"
+# The first wait on a post page also ends as soon as a paywall is shown, so premium posts can be skipped early
+_ARTICLE_OR_PAYWALL_READY_JS = (
+    f"({_ARTICLE_READY_JS}) || !!document.querySelector(\"[data-testid='paywall'], .paywall, h2.paywall-title\")"
+)
+_LOGIN_FORM_READY_JS = "!!document.querySelector('input[type=email], input[name=email]')"
+_PASSWORD_FIELD_READY_JS = "!!document.querySelector('input[name=password]')"
+# The sign-in form was submitted: the page either left the sign-in URL or shows the error container
+_LOGIN_SETTLED_JS = "!location.href.includes('sign-in') || !!document.getElementById('error-container')"
+# The sign-in error message, or null when the page shows no error container
+_LOGIN_ERROR_JS = "document.getElementById('error-container')?.innerText ?? null"
+_SUBSCRIBED_JS = 'document.documentElement.outerHTML.includes(`is_subscribed":true`)'
+_CONTENT_SIZE_JS = """
+(() => {
+    const el = document.querySelector("div.body.markup, .available-content, article");
+    return el ? el.innerHTML.length : -1;
+})()
+"""
+_PAYWALL_GONE_JS = "!document.querySelector('[data-testid=paywall], .paywall')"
+_PAYWALL_CSS = "[data-testid='paywall'], .paywall, h2.paywall-title"
+_POST_BODY_MARKER = b'class="body markup"'
+# Post content containers, in order of preference (the post body first, generic containers last)
+_CONTENT_SELECTORS = [
+    ("div.body.markup", "div.body.markup"),
+    ("available-content", ".available-content"),
+    ("article", "article"),
+    ("post-content", ".post-content"),
+    ("main", "main"),
+    ("content", ".content"),
+    ("post", ".post"),
+]
+# Names the first content container on the page (or null); built once, evaluated once per poll
+_CONTENT_MATCH_JS = f"""
+(() => {{
+    for (const [name, selector] of {json.dumps(_CONTENT_SELECTORS)}) {{
+        if (document.querySelector(selector)) return name;
+    }}
+    return null;
+}})()
+"""
+# Everything extracted from a post lives in <body>; skipping <head> (meta, link, style, script tags) saves nodes
+_BODY_ONLY = SoupStrainer("body")
+# Substack keeps the post header, byline, like button and body inside <article>, apart from the navigation,
+# recommendations, comments and footer around it
+_ARTICLE_ONLY = SoupStrainer("article")
+_ARTICLE_TAG = b"<article"
+# The post fields' selectors, compiled once with soupsieve (bs4's CSS engine) instead of per select_one call
+_TITLE_SELECTOR = soupsieve.compile("h1.post-title, h2")
+_SUBTITLE_SELECTOR = soupsieve.compile("h3.subtitle")
+_LIKE_COUNT_SELECTOR = soupsieve.compile("a.post-ufi-button .label")
+# The date selectors compiled one by one, plus all of them at once to collect the candidates in a single walk
+_DATE_SELECTOR_LIST = [soupsieve.compile(selector) for selector in _DATE_SELECTORS]
+_ANY_DATE_SELECTOR = soupsieve.compile(", ".join(_DATE_SELECTORS))
+_CONTENT_ELEMENT_SELECTORS = [
+    soupsieve.compile("div.available-content div.body.markup"),
+    soupsieve.compile("div.available-content"),
+    soupsieve.compile("article"),
+]
+_ANALYTICS_FLAG_RE = re.compile(rb'"(is_\w+)":(true|false)')
+
+
+def parse_date_fast(date_text: str) -> datetime | None:
+    """Parse the common Substack date formats without going through dateparser.
+
+    Returns None when the text doesn't match a known format so callers can fall back to dateparser.
+    """
+    date_text = date_text.strip()
+    try:
+        match = _ISO_DATE_RE.match(date_text)
+        if match:
+            return datetime(int(match[1]), int(match[2]), int(match[3]))
+
+        match = _MDY_DATE_RE.match(date_text)
+        if match and match[1] in _MONTHS:
+            return datetime(int(match[3]), _MONTHS[match[1]], int(match[2]))
+    except ValueError:
+        # Out-of-range day/month - let dateparser decide
+        pass
+    return None
+
 
+def _parse_date_slow(date_text: str) -> datetime | None:
+    """Parse any other date format with dateparser, imported on first use.
 
+    dateparser takes about a third of the module's import time (its timezone tables), and most runs never get
+    past parse_date_fast, so the CLI (and --help) doesn't pay for it up front.
+    """
+    import dateparser
+
+    return dateparser.parse(date_text, settings=_DATEPARSER_SETTINGS)
+
+
+@functools.lru_cache(maxsize=256)
 def extract_main_part(url: str) -> str:
     """Extract the main part of a domain from a URL."""
-    netloc = urlparse(url).netloc.lower()
+    netloc = urlsplit(url).netloc.lower()
 
     # Remove www. prefix if present
     if netloc.startswith("www."):
@@ -99,6 +410,206 @@ def extract_main_part(url: str) -> str:
     return parts[0] if parts else "unknown"
 
 
+def _iter_xml_elements(content: bytes, tag: str) -> Iterator[Any]:
+    """Stream the elements named tag out of an XML document, freeing each one once it has been handled."""
+    for _, element in etree.iterparse(BytesIO(content), tag=tag):
+        yield element
+        element.clear(keep_tail=True)
+        # Drop the already-processed siblings of the element and of its ancestors (a <loc>'s earlier <url>s), so
+        # the partial tree stays small however many entries the document has
+        for node in itertools.chain((element,), element.iterancestors()):
+            parent = node.getparent()
+            if parent is None:
+                break
+            while node.getprevious() is not None:
+                del parent[0]
+
+
+@functools.lru_cache(maxsize=256)
+def _filename_part(text: str, max_len: int) -> str:
+    """Strip non-word characters and collapse dashes/whitespace; cached since every image of a post shares its title."""
+    return _DASH_RE.sub("-", _NON_WORD_RE.sub("", text).strip())[:max_len]
+
+
+@functools.lru_cache(maxsize=64)
+def _image_date_prefix(post_date: str) -> str:
+    """YYYYMMDD prefix for image filenames, or "" if post_date can't be parsed; parsed once per post."""
+    try:
+        return dateutil.parser.parse(post_date).strftime("%Y%m%d")
+    except Exception:
+        return ""
+
+
+@functools.lru_cache(maxsize=16)
+def _keyword_pattern(keywords: tuple[str, ...]) -> re.Pattern[str]:
+    """One alternation regex so filter_urls scans each URL once for all keywords."""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+_markdown_local = threading.local()
+
+
+def _render_markdown(md_content: str) -> str:
+    """Markdown -> HTML, reusing one Markdown instance per thread instead of loading the extensions on every call."""
+    md = getattr(_markdown_local, "md", None)
+    if md is None:
+        md = _markdown_local.md = markdown.Markdown(extensions=["extra"])
+    return md.reset().convert(md_content)
+
+
+def _parse_post_html(page_source: bytes) -> BeautifulSoup:
+    """Parse a post page's <article> with lxml, or its whole <body> if it has none (run via asyncio.to_thread)."""
+    strainer = _ARTICLE_ONLY if _ARTICLE_TAG in page_source else _BODY_ONLY
+    return BeautifulSoup(page_source, "lxml", from_encoding="utf-8", parse_only=strainer)
+
+
+def _retry_delay(retry_after: str | None, attempt: int) -> float:
+    """Seconds to wait before retrying: the server's Retry-After in seconds (capped), else exponential backoff."""
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), IMAGE_RETRY_AFTER_MAX)
+    return 0.5 * 2 ** (attempt - 1)
+
+
+def _read_json_file(path: str) -> Any:
+    """Parse a JSON file, with orjson when it is installed (run via asyncio.to_thread)."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _read_text_file(path: str) -> str:
+    """Read a whole UTF-8 text file (run via asyncio.to_thread)."""
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def _write_text_file(path: str, content: str) -> None:
+    """Write a whole UTF-8 text file in one go (run via asyncio.to_thread)."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+def _dump_json_bytes(data: Any) -> bytes:
+    """Serialize data to UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=4).encode("utf-8")
+
+
+def _write_bytes_atomic(path: str, payload: bytes) -> None:
+    """Replace a file's contents via a temp file and os.replace (run via asyncio.to_thread)."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def _write_json_file(path: str, data: Any) -> None:
+    """Serialize data and atomically replace path with it (run via asyncio.to_thread)."""
+    _write_bytes_atomic(path, _dump_json_bytes(data))
+
+
+def _merge_essays_file(path: str, essays_data: list[dict[str, Any]]) -> None:
+    """Add essays to the JSON list at path, deduplicated by post URL (run via asyncio.to_thread).
+
+    Reading, merging and serializing a long list all happen here, off the event loop.
+    """
+    existing_data: list[dict[str, Any]] = []
+    with contextlib.suppress(FileNotFoundError):
+        loaded_data = _read_json_file(path)
+        if isinstance(loaded_data, list):
+            existing_data = loaded_data
+
+    # Deduplicate by post URL, also within this batch
+    seen_urls = {data.get("url") for data in existing_data}
+    merged_data = existing_data
+    for data in essays_data:
+        url = data.get("url")
+        if url not in seen_urls:
+            seen_urls.add(url)
+            merged_data.append(data)
+
+    _write_json_file(path, merged_data)
+
+
+def _write_private_file(path: str, payload: bytes) -> None:
+    """Atomically write a file only the current user can read (run via asyncio.to_thread)."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def _prompt_in_background(prompt: str) -> asyncio.Future[str]:
+    """input() on a daemon thread, so an unanswered prompt blocks neither the event loop nor interpreter exit."""
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[str] = loop.create_future()
+
+    def answer(line: str) -> None:
+        if not future.done():
+            future.set_result(line)
+
+    def read() -> None:
+        try:
+            line = input(prompt)
+        except (EOFError, OSError):  # No terminal to answer from: rely on automatic detection
+            return
+        with contextlib.suppress(RuntimeError):  # The event loop may be gone by then
+            loop.call_soon_threadsafe(answer, line)
+
+    threading.Thread(target=read, daemon=True).start()
+    return future
+
+
+def _write_post_files(md_path: str, md_content: str, html_path: str, html_content: str) -> bool:
+    """Write a post's markdown and HTML files (run via asyncio.to_thread).
+
+    An existing markdown file is left untouched, matching save_to_file. Returns False in that case.
+    """
+    md_written = False
+    if not os.path.exists(md_path):
+        with open(md_path, "w", encoding="utf-8") as f:
+            f.write(md_content)
+        md_written = True
+
+    with open(html_path, "w", encoding="utf-8") as f:
+        f.write(html_content)
+    return md_written
+
+
+class _LoginState:
+    """Whether the browser session is logged in, and whether that login came from saved cookies."""
+
+    def __init__(self) -> None:
+        self.is_logged_in = False
+        self.session_restored = False
+
+
+class _RequestPacer:
+    """Shared token bucket of size one: request starts are spaced by a random delay from delay_range.
+
+    Workers reserve the next free slot before sleeping, so the gaps hold across all of them without a lock and
+    nobody sleeps when the previous request was long enough ago.
+    """
+
+    def __init__(self) -> None:
+        self._next_slot = 0.0
+
+    async def wait(self, delay_range: tuple[float, float]) -> None:
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + random.uniform(delay_range[0], delay_range[1])
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def hold(self, seconds: float) -> None:
+        """Keep every waiter from starting a request for the next seconds, e.g. when the server answered 429."""
+        self._next_slot = max(self._next_slot, time.monotonic() + seconds)
+
+
 async def generate_html_file(author_name: str) -> None:
     """Generates a HTML file for the given author."""
     if not os.path.exists(BASE_HTML_DIR):
@@ -111,14 +622,11 @@ async def generate_html_file(author_name: str) -> None:
         print(f"No JSON data file found for {author_name}, skipping HTML generation")
         return
 
-    async with aiofiles.open(json_path, encoding="utf-8") as file:
-        content = await file.read()
-        essays_data = json.loads(content)
-
-    embedded_json_data = json.dumps(essays_data, ensure_ascii=False, indent=4)
+    # save_essays_data_to_json writes the file as JSON already, so it is embedded as is rather than parsed and
+    # serialized again
+    embedded_json_data = await asyncio.to_thread(_read_text_file, json_path)
 
-    async with aiofiles.open(HTML_TEMPLATE, encoding="utf-8") as file:
-        html_template = await file.read()
+    html_template = await asyncio.to_thread(_read_text_file, HTML_TEMPLATE)
 
     html_with_data = html_template.replace("<!-- AUTHOR_NAME -->", author_name).replace(
         '<script type="application/json" id="essaysData"></script>',
@@ -127,24 +635,50 @@ async def generate_html_file(author_name: str) -> None:
     html_with_author = html_with_data.replace("author_name", author_name)
 
     html_output_path = os.path.join(BASE_HTML_DIR, f"{author_name}.html")
-    async with aiofiles.open(html_output_path, "w", encoding="utf-8") as file:
-        await file.write(html_with_author)
+    await asyncio.to_thread(_write_text_file, html_output_path, html_with_author)
 
 
 class BaseSubstackScraper(ABC):
     """Abstract base class for Substack scrapers."""
 
+    # Number of posts scraped at the same time by scrape_posts
+    max_concurrent = 4
+
     def __init__(
         self, base_substack_url: str, md_save_dir: str, html_save_dir: str, delay_range: tuple[int, int] = (1, 3)
     ):
+        self.md_root_dir = md_save_dir
+        self.html_root_dir = html_save_dir
+        self.keywords = ["about", "archive", "podcast"]
+
+        # Delay configuration for rate limiting; one pacer per scraper, so the spacing also holds from one
+        # scrape_posts call (or Substack) to the next and across the views of a tab pool
+        self.delay_range = delay_range
+        self._pacer = _RequestPacer()
+
+        # Shared HTTP session for image downloads, created on first use
+        self._http_session: aiohttp.ClientSession | None = None
+        self._image_semaphore = asyncio.BoundedSemaphore(IMAGE_DOWNLOAD_CONCURRENCY)
+        # Holds back every image request while the CDN asks us to back off, not just the request that was refused
+        self._image_pacer = _RequestPacer()
+        # Downloads in flight by URL hash + extension, so an image used twice in or across posts is fetched once
+        self._image_downloads: dict[str, asyncio.Task[str]] = {}
+
+        self.retarget(base_substack_url)
+
+    def retarget(self, base_substack_url: str) -> None:
+        """Point the scraper at a Substack: set up its directories and fetch its post URLs."""
         if not base_substack_url.endswith("/"):
             base_substack_url += "/"
         self.base_substack_url = base_substack_url
         self.writer_name = extract_main_part(base_substack_url)
+        base_parts = urlsplit(base_substack_url)
+        self._base_scheme = base_parts.scheme
+        self._base_origin = f"{base_parts.scheme}://{base_parts.netloc}"
 
-        md_save_dir = f"{md_save_dir}/{self.writer_name}"
+        md_save_dir = f"{self.md_root_dir}/{self.writer_name}"
         self.md_save_dir = md_save_dir
-        self.html_save_dir = f"{html_save_dir}/{self.writer_name}"
+        self.html_save_dir = f"{self.html_root_dir}/{self.writer_name}"
 
         # Create directories if they don't exist
         os.makedirs(md_save_dir, exist_ok=True)
@@ -157,11 +691,15 @@ class BaseSubstackScraper(ABC):
         os.makedirs(self.images_dir, exist_ok=True)
         print(f"Created images directory {self.images_dir}")
 
-        self.keywords = ["about", "archive", "podcast"]
+        # Image files already on disk, listed on the first download (runs where every post is already saved never
+        # need it) and updated as images are downloaded
+        self._downloaded_images: dict[str, str] | None = None
+
         self.post_urls = self.get_all_post_urls()
 
-        # Delay configuration for rate limiting
-        self.delay_range = delay_range
+        # Slugs of posts already saved to md_save_dir, built lazily and updated in place as posts are written
+        self._existing_slugs: set[str] | None = None
+        self._json_dir_ready = False
 
     def get_all_post_urls(self) -> list[str]:
         """Attempts to fetch URLs from sitemap.xml, falling back to feed.xml if necessary."""
@@ -176,8 +714,7 @@ class BaseSubstackScraper(ABC):
         state_file = os.path.join(self.md_save_dir, ".scraping_state.json")
         if os.path.exists(state_file):
             try:
-                with open(state_file) as f:
-                    return json.load(f)
+                return _read_json_file(state_file)
             except Exception as e:
                 print(f"Error loading scraping state: {e}")
         return {}
@@ -186,8 +723,7 @@ class BaseSubstackScraper(ABC):
         """Save the scraping state to the metadata file."""
         state_file = os.path.join(self.md_save_dir, ".scraping_state.json")
         try:
-            async with aiofiles.open(state_file, "w") as f:
-                await f.write(json.dumps(state, indent=2))
+            await asyncio.to_thread(_write_json_file, state_file, state)
         except Exception as e:
             print(f"Error saving scraping state: {e}")
 
@@ -196,27 +732,32 @@ class BaseSubstackScraper(ABC):
 
         Returns a set of URL slugs that have already been downloaded.
         Handles both date-prefixed (YYYYMMDD-slug.md) and old format (slug.md) files.
+        The directory is only scanned once per scraper; later posts are added by scrape_single_post_with_date.
         """
-        existing_urls = set()
+        if self._existing_slugs is not None:
+            return self._existing_slugs
 
-        # Check all markdown files
-        pattern = os.path.join(self.md_save_dir, "*.md")
-        md_files = glob.glob(pattern)
+        existing_urls: set[str] = set()
+        md_file_count = 0
 
-        for filepath in md_files:
-            filename = os.path.basename(filepath)
+        # Single directory pass; DirEntry names avoid building full paths the way glob does
+        with os.scandir(self.md_save_dir) as entries:
+            for entry in entries:
+                filename = entry.name
+                if not filename.endswith(".md"):
+                    continue
+                md_file_count += 1
 
-            # Handle date-prefixed files (YYYYMMDD-*.md)
-            if len(filename) > 9 and filename[8] == "-" and filename[:8].isdigit():
-                # Remove date prefix and .md extension
-                url_part = filename[9:-3]
-                existing_urls.add(url_part)
-            else:
-                # Handle old format files (just remove .md)
-                url_part = filename[:-3]
-                existing_urls.add(url_part)
+                # Handle date-prefixed files (YYYYMMDD-*.md)
+                if len(filename) > 9 and filename[8] == "-" and filename[:8].isdigit():
+                    # Remove date prefix and .md extension
+                    existing_urls.add(filename[9:-3])
+                else:
+                    # Handle old format files (just remove .md)
+                    existing_urls.add(filename[:-3])
 
-        print(f"Found {len(existing_urls)} existing URL slugs in {len(md_files)} markdown files")
+        print(f"Found {len(existing_urls)} existing URL slugs in {md_file_count} markdown files")
+        self._existing_slugs = existing_urls
         return existing_urls
 
     def fetch_urls_from_sitemap(self) -> list[str]:
@@ -224,19 +765,48 @@ class BaseSubstackScraper(ABC):
         # Ensure base URL ends with /
         base_url = self.base_substack_url.rstrip("/") + "/"
         sitemap_url = f"{base_url}sitemap.xml"
+        # The sitemap seen on the last run, so an unchanged one is neither downloaded nor parsed again
+        cache_file = os.path.join(self.md_save_dir, ".sitemap_cache.json")
+        cached: dict[str, Any] = {}
+        with contextlib.suppress(Exception):
+            loaded = _read_json_file(cache_file)
+            if isinstance(loaded, dict) and loaded.get("url") == sitemap_url and loaded.get("urls"):
+                cached = loaded
+        headers = {}
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
         try:
-            response = requests.get(sitemap_url, timeout=10)
+            response = requests.get(sitemap_url, headers=headers, timeout=10)
+            if response.status_code == 304 and cached:
+                print(f"Sitemap unchanged, reusing {len(cached['urls'])} URLs from the last run")
+                return list(cached["urls"])
             if not response.ok:
                 print(f"Error fetching sitemap at {sitemap_url}: {response.status_code}")
                 return []
 
-            root = ET.fromstring(response.content)
-            urls = [
-                element.text
-                for element in root.iter("{http://www.sitemaps.org/schemas/sitemap/0.9}loc")
-                if element.text
-            ]
+            # Servers that ignore conditional requests still send the same bytes for an unchanged sitemap
+            content_hash = hashlib.blake2b(response.content, digest_size=16).hexdigest()
+            if cached.get("content_hash") == content_hash:
+                urls = list(cached["urls"])
+            else:
+                urls = [
+                    element.text for element in _iter_xml_elements(response.content, _SITEMAP_LOC_TAG) if element.text
+                ]
             print(f"Found {len(urls)} URLs in sitemap")
+            if urls:
+                cache = {
+                    "url": sitemap_url,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "content_hash": content_hash,
+                    "urls": urls,
+                }
+                try:
+                    _write_json_file(cache_file, cache)
+                except Exception as e:
+                    print(f"Error saving sitemap cache: {e}")
             return urls
         except requests.exceptions.ConnectionError as e:
             if "NameResolutionError" in str(e) or "Failed to resolve" in str(e):
@@ -261,9 +831,8 @@ class BaseSubstackScraper(ABC):
                 print(f"Error fetching feed at {feed_url}: {response.status_code}")
                 return []
 
-            root = ET.fromstring(response.content)
             urls: list[str] = []
-            for item in root.findall(".//item"):
+            for item in _iter_xml_elements(response.content, "item"):
                 link = item.find("link")
                 if link is not None and link.text:
                     urls.append(link.text)
@@ -282,7 +851,11 @@ class BaseSubstackScraper(ABC):
     @staticmethod
     def filter_urls(urls: list[str], keywords: list[str]) -> list[str]:
         """Filters out URLs that contain certain keywords."""
-        filtered = [url for url in urls if all(keyword not in url for keyword in keywords)]
+        if not keywords:
+            filtered = list(urls)
+        else:
+            search = _keyword_pattern(tuple(keywords)).search
+            filtered = [url for url in urls if search(url) is None]
         print(f"Filtered {len(urls)} URLs to {len(filtered)} post URLs")
         return filtered
 
@@ -310,22 +883,22 @@ class BaseSubstackScraper(ABC):
             print(f"File already exists: {filepath}")
             return
 
-        async with aiofiles.open(filepath, "w", encoding="utf-8") as file:
-            await file.write(content)
+        await asyncio.to_thread(_write_text_file, filepath, content)
 
     @staticmethod
     def md_to_html(md_content: str) -> str:
         """Converts Markdown to HTML."""
-        return markdown.markdown(md_content, extensions=["extra"])
+        return _render_markdown(md_content)
 
-    async def save_to_html_file(self, filepath: str, content: str) -> None:
-        """Saves HTML content to a file with CSS link."""
+    @staticmethod
+    def build_html_page(filepath: str, content: str) -> str:
+        """Wraps HTML content in a standalone page with a CSS link relative to filepath."""
 
         html_dir = os.path.dirname(filepath)
         css_path = os.path.relpath("./assets/css/essay-styles.css", html_dir)
         css_path = css_path.replace("\\", "/")
 
-        html_content = f"""<!DOCTYPE html>
+        return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -340,8 +913,12 @@ class BaseSubstackScraper(ABC):
 </body>
 </html>"""
 
-        async with aiofiles.open(filepath, "w", encoding="utf-8") as file:
-            await file.write(html_content)
+    async def save_to_html_file(self, filepath: str, content: str) -> None:
+        """Saves HTML content to a file with CSS link."""
+
+        html_content = self.build_html_page(filepath, content)
+
+        await asyncio.to_thread(_write_text_file, filepath, html_content)
 
     @staticmethod
     def get_filename_from_url(url: str, filetype: str = ".md") -> str:
@@ -370,16 +947,58 @@ class BaseSubstackScraper(ABC):
         metadata += f"**Likes:** {like_count}\n\n"
         return metadata + content
 
+    async def _get_http_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, limit_per_host=IMAGE_DOWNLOAD_CONCURRENCY),
+                headers={"User-Agent": USER_AGENT} if USER_AGENT else None,
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+        return self._http_session
+
+    async def close_http_session(self) -> None:
+        """Close the shared HTTP session, if one was opened."""
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+
+    async def _download_to_file(self, url: str, path: str) -> None:
+        """Stream url to path with the shared session, retrying 429 and 5xx responses with exponential backoff.
+
+        The body is written in chunks to a temporary file that replaces path once complete.
+        """
+        session = await self._get_http_session()
+        attempt = 1
+        while True:
+            await self._image_pacer.wait((0, 0))
+            async with session.get(url) as response:
+                if attempt >= IMAGE_DOWNLOAD_RETRIES or not (response.status == 429 or response.status >= 500):
+                    response.raise_for_status()
+                    tmp_path = f"{path}.part"
+                    try:
+                        async with aiofiles.open(tmp_path, "wb") as f:
+                            async for chunk in response.content.iter_chunked(IMAGE_DOWNLOAD_CHUNK_SIZE):
+                                await f.write(chunk)
+                        os.replace(tmp_path, path)
+                    except BaseException:
+                        with contextlib.suppress(OSError):
+                            os.remove(tmp_path)
+                        raise
+                    return
+                logger.debug("Retrying %s after HTTP %s", url, response.status)
+                self._image_pacer.hold(_retry_delay(response.headers.get("Retry-After"), attempt))
+            attempt += 1
+
     async def download_image(self, img_url: str, post_title: str, img_context: str = "", post_date: str = "") -> str:
         """Download image and return local path with descriptive filename."""
         try:
             # Clean the post title for use in filename
-            safe_title = re.sub(r"[^\w\s-]", "", post_title).strip()
-            safe_title = re.sub(r"[-\s]+", "-", safe_title)[:50]  # Limit length
+            safe_title = _filename_part(post_title, 50)  # Limit length
 
             # Extract original filename or description from URL
-            parsed_url = urlparse(img_url)
-            path = parsed_url.path
+            # urlsplit skips urlparse's ;params pass, which image URLs never need
+            path = urlsplit(img_url).path
             original_name = os.path.basename(path)
             name_without_ext = os.path.splitext(original_name)[0]
             ext = os.path.splitext(path)[1] or ".jpg"
@@ -387,8 +1006,7 @@ class BaseSubstackScraper(ABC):
             # Try to extract meaningful name from the original filename
             if name_without_ext and not name_without_ext.isdigit() and len(name_without_ext) > 3:
                 # Clean the original name
-                clean_name = re.sub(r"[^\w\s-]", "", name_without_ext).strip()
-                clean_name = re.sub(r"[-\s]+", "-", clean_name)[:30]
+                clean_name = _filename_part(name_without_ext, 30)
             else:
                 clean_name = ""
 
@@ -396,13 +1014,9 @@ class BaseSubstackScraper(ABC):
             parts = []
 
             # Add date prefix if available
-            if post_date:
-                try:
-                    parsed_date = dateutil.parser.parse(post_date)
-                    date_prefix = parsed_date.strftime("%Y%m%d")
-                    parts.append(date_prefix)
-                except Exception:
-                    pass
+            date_prefix = _image_date_prefix(post_date) if post_date else ""
+            if date_prefix:
+                parts.append(date_prefix)
 
             # Add post title
             if safe_title:
@@ -410,15 +1024,14 @@ class BaseSubstackScraper(ABC):
 
             # Add image context or original name
             if img_context:
-                clean_context = re.sub(r"[^\w\s-]", "", img_context).strip()
-                clean_context = re.sub(r"[-\s]+", "-", clean_context)[:30]
+                clean_context = _filename_part(img_context, 30)
                 if clean_context:
                     parts.append(clean_context)
             elif clean_name:
                 parts.append(clean_name)
 
-            # Add a short hash for uniqueness (only 6 chars)
-            img_hash = str(abs(hash(img_url)))[:6]
+            # Add a short hash for uniqueness, stable across runs so existing downloads are recognized
+            img_hash = hashlib.blake2b(img_url.encode("utf-8"), digest_size=_IMAGE_HASH_LEN // 2).hexdigest()
             parts.append(img_hash)
 
             # Create filename
@@ -427,42 +1040,86 @@ class BaseSubstackScraper(ABC):
             if len(filename) > 200:
                 filename = filename[:196] + img_hash + ext
 
-            local_path = os.path.join(self.images_dir, filename)
-
-            # Check if already downloaded
-            if os.path.exists(local_path):
-                return f"images/{filename}"
-
-            # Download with rate limiting
-            print(f"  Downloading image: {filename}")
-            response = requests.get(img_url, headers={"User-Agent": USER_AGENT}, timeout=30)
-            response.raise_for_status()
-
-            # Save image
-            with open(local_path, "wb") as f:
-                f.write(response.content)
-
-            # Add small delay for rate limiting (3-10ms)
-            delay = random.uniform(0.003, 0.01)
-            await asyncio.sleep(delay)
+            # Check if already downloaded, possibly under another name (the alt text or title changed since): the
+            # filename ends in the URL's hash either way
+            image_key = img_hash + ext
+            known_filename = self._image_files().get(image_key)
+            if known_filename is not None:
+                return f"images/{known_filename}"
+
+            download = self._image_downloads.get(image_key)
+            if download is None:
+                logger.debug("Downloading image: %s", filename)
+                download = asyncio.create_task(self._download_image_file(img_url, filename, image_key))
+                self._image_downloads[image_key] = download
+                download.add_done_callback(lambda _: self._image_downloads.pop(image_key, None))
+            # A cancelled post must not cancel the download another post waits on
+            filename = await asyncio.shield(download)
 
             return f"images/{filename}"
         except Exception as e:
             print(f"  Error downloading image {img_url}: {e}")
         return img_url  # Return original URL on error
 
-    async def process_images_in_content(self, content: str, post_title: str, post_date: str = "") -> str:
-        """Process all images in content and replace with local paths."""
-        soup = BeautifulSoup(content, "html.parser")
-        images = soup.find_all("img")
+    async def _download_image_file(self, img_url: str, filename: str, image_key: str) -> str:
+        """Download an image into images_dir, at most IMAGE_DOWNLOAD_CONCURRENCY images at a time.
+
+        Returns: filename
+        """
+        async with self._image_semaphore:
+            await self._download_to_file(img_url, os.path.join(self.images_dir, filename))
+        self._image_files()[image_key] = filename
+        return filename
+
+    def _image_files(self) -> dict[str, str]:
+        """Filenames in images_dir by their URL hash + extension suffix, scanned once per Substack."""
+        if self._downloaded_images is None:
+            with os.scandir(self.images_dir) as entries:
+                self._downloaded_images = {}
+                for entry in entries:
+                    stem, ext = os.path.splitext(entry.name)
+                    self._downloaded_images[stem[-_IMAGE_HASH_LEN:] + ext] = entry.name
+        return self._downloaded_images
+
+    def _absolute_url(self, src: str) -> str:
+        """Resolve src against the Substack URL, concatenating for the common forms instead of calling urljoin."""
+        if src.startswith(("http://", "https://")):
+            return src
+        if src.startswith("//"):
+            return f"{self._base_scheme}:{src}"
+        if src.startswith("/") and "/." not in src:  # Dot segments still need urljoin's normalization
+            return self._base_origin + src
+        return urljoin(self.base_substack_url, src)
+
+    async def process_images_in_content(self, content: str | Tag, post_title: str, post_date: str = "") -> str:
+        """Process all images in content and replace with local paths.
+
+        content is either HTML or an already parsed element, which is updated in place instead of re-parsed.
+        """
+        if isinstance(content, str):
+            if not _IMG_TAG_RE.search(content):
+                return content
+            soup = BeautifulSoup(content, "lxml")
+            # lxml wraps fragments in <html><body>; hand back just the fragment, as html.parser did
+            fragment = soup.body if soup.body is not None and not _BODY_TAG_RE.search(content) else None
+        else:
+            soup = content
+            fragment = None
+        await self._localize_images(soup, post_title, post_date)
+
+        return fragment.decode_contents() if fragment is not None else str(soup)
+
+    async def _localize_images(self, element: Tag, post_title: str, post_date: str) -> None:
+        """Download the images under element and point their src at the local copies, in place."""
+        images = element.find_all("img")
 
+        downloads = []
         for img in images:
             if hasattr(img, "get") and hasattr(img, "__setitem__"):  # Type guard for Tag
                 src = img.get("src")  # type: ignore
                 if src and isinstance(src, str):  # Type guard
                     # Make URL absolute if relative
-                    if not src.startswith(("http://", "https://")):
-                        src = urljoin(self.base_substack_url, src)
+                    src = self._absolute_url(src)
 
                     # Extract image context from alt text or nearby text
                     img_context = ""
@@ -470,146 +1127,85 @@ class BaseSubstackScraper(ABC):
                     if alt_text and isinstance(alt_text, str):
                         img_context = alt_text[:50]  # Limit length
 
-                    # Download image and get local path
-                    local_path = await self.download_image(src, post_title, img_context, post_date)
-                    img["src"] = local_path  # type: ignore
+                    downloads.append((img, self.download_image(src, post_title, img_context, post_date)))
 
-        return str(soup)
+        # Download all images concurrently (bounded by the image semaphore) and point them at the local copies
+        local_paths = await asyncio.gather(*[download for _, download in downloads])
+        for (img, _), local_path in zip(downloads, local_paths):
+            img["src"] = local_path  # type: ignore
+
+    def _element_to_md(self, element: Tag | None) -> str:
+        """Serialize element (if any) and convert it to Markdown (run via asyncio.to_thread)."""
+        return self.html_to_md(str(element) if element is not None else "")
+
+    @staticmethod
+    def _extract_date(soup: BeautifulSoup) -> str:
+        """Find the post date: the first date selector match's datetime attribute, else its date-like text."""
+        # One walk finds every element any selector matches, in document order; each selector's first match (what
+        # select_one would return) is then the first candidate it matches
+        candidates = _ANY_DATE_SELECTOR.select(soup)
+        for selector in _DATE_SELECTOR_LIST:
+            date_elem = next((candidate for candidate in candidates if selector.match(candidate)), None)
+            if date_elem is None:
+                continue
+            # Try to get datetime attribute first
+            date_attr = date_elem.get("datetime")
+            if date_attr and str(date_attr) != "None":
+                logger.debug("Date found from datetime attribute: %s", date_attr)
+                return str(date_attr)
+
+            # Check if this element has child divs that might contain the actual date
+            for child in date_elem.find_all("div"):
+                child_text = child.get_text(strip=True)
+                # The innermost div naming a month ([1:] skips its own text node)
+                if child_text and _MONTH_RE.search(child_text) and not child.find_all(text=True, recursive=False)[1:]:
+                    logger.debug("Date extracted from innermost div: %s", child_text)
+                    return child_text
+
+            raw_text = date_elem.text.strip()
+            if raw_text and raw_text != "None":
+                # Split off author names and extra content; prefer the part that names a month, else the first part
+                # that contains numbers
+                parts = _DATE_PART_SEP_RE.split(raw_text)
+                date_part = next((part for part in parts if _MONTH_RE.search(part)), None) or next(
+                    (part for part in parts if _DIGIT_RE.search(part)), None
+                )
+                if date_part:
+                    logger.debug("Date extracted from text: %s", date_part.strip())
+                    return date_part.strip()
+        return "Date not found"
 
     async def extract_post_data(self, soup: BeautifulSoup, url: str) -> tuple[str, str, str, str, str]:
         """Extracts post data from BeautifulSoup object."""
         # Title extraction
-        title_elem = soup.select_one("h1.post-title, h2")
+        title_elem = _TITLE_SELECTOR.select_one(soup)
         title = title_elem.text.strip() if title_elem else "Untitled"
 
         # Subtitle extraction
-        subtitle_elem = soup.select_one("h3.subtitle")
+        subtitle_elem = _SUBTITLE_SELECTOR.select_one(soup)
         subtitle = subtitle_elem.text.strip() if subtitle_elem else ""
 
-        # Date extraction - try multiple selectors
-        date = "Date not found"
-        date_selectors = [
-            # Very specific selector for the date div in byline-wrapper
-            # Target the date-containing div that has classes like 'color-pub-secondary-text-*'
-            "div.byline-wrapper div[class*='color-pub-secondary-text'] > div",
-            # More specific: the innermost div that contains the date text
-            "div.byline-wrapper div.pencraft.pc-display-flex.pc-gap-4 div[class*='color-pub-secondary-text']",
-            # Even more specific: look for div with date-like classes
-            "div[class*='date'][class*='pub-secondary']",
-            # Time elements with datetime attribute
-            "time[datetime]",  # Time elements with datetime
-            "article time[datetime]",  # Time in article with datetime
-            "div.post-header time[datetime]",  # Time in post header
-            # Text-based selectors as fallback
-            "span.post-meta-date",
-            "div.post-date",
-            "div.post-meta time",
-            "span[class*='date']",
-        ]
-
-        for selector in date_selectors:
-            date_elem = soup.select_one(selector)
-            if date_elem:
-                # Try to get datetime attribute first
-                date_attr = date_elem.get("datetime")
-                if date_attr and str(date_attr) != "None":
-                    date = str(date_attr)
-                    print(f"  Date found from datetime attribute: {date}")
-                    break
-                else:
-                    # Check if this element has child divs that might contain the actual date
-                    child_divs = date_elem.find_all("div")
-                    if child_divs:
-                        # Try to get the innermost div that contains text
-                        for child in child_divs:
-                            child_text = child.get_text(strip=True)
-                            # Check if this looks like a date
-                            if child_text and any(
-                                month in child_text
-                                for month in [
-                                    "Jan",
-                                    "Feb",
-                                    "Mar",
-                                    "Apr",
-                                    "May",
-                                    "Jun",
-                                    "Jul",
-                                    "Aug",
-                                    "Sep",
-                                    "Oct",
-                                    "Nov",
-                                    "Dec",
-                                ]
-                            ):
-                                # Check if this div has no children with text (i.e., it's the innermost)
-                                if not child.find_all(text=True, recursive=False)[1:]:  # [1:] to skip its own text
-                                    date = child_text
-                                    print(f"  Date extracted from innermost div: {date}")
-                                    break
-
-                    # If we didn't find it in child divs, try the original element
-                    if date == "Date not found":
-                        raw_text = date_elem.text.strip()
-                        if raw_text and raw_text != "None":
-                            # Clean up the text - remove author names and extra content
-                            # Split by common separators and look for date patterns
-                            parts = raw_text.split("∙")
-                            for part in parts:
-                                # Check if this part looks like a date
-                                if any(
-                                    month in part
-                                    for month in [
-                                        "Jan",
-                                        "Feb",
-                                        "Mar",
-                                        "Apr",
-                                        "May",
-                                        "Jun",
-                                        "Jul",
-                                        "Aug",
-                                        "Sep",
-                                        "Oct",
-                                        "Nov",
-                                        "Dec",
-                                    ]
-                                ):
-                                    date = part.strip()
-                                    print(f"  Date extracted from text: {date}")
-                                    break
-                            else:
-                                # If no month found, use the first part that contains numbers
-                                for part in parts:
-                                    if any(char.isdigit() for char in part):
-                                        date = part.strip()
-                                        print(f"  Date extracted from text: {date}")
-                                        break
-
-                    if date != "Date not found":
-                        break
+        date = self._extract_date(soup)
 
         # Like count extraction
-        like_count_elem = soup.select_one("a.post-ufi-button .label")
+        like_count_elem = _LIKE_COUNT_SELECTOR.select_one(soup)
         like_count = "0"
         if like_count_elem:
             text = like_count_elem.text.strip()
             if text.isdigit():
                 like_count = text
 
-        # Content extraction - look for the actual content container
-        content_elem = soup.select_one("div.available-content div.body.markup")
-        if not content_elem:
-            # Fallback to available-content
-            content_elem = soup.select_one("div.available-content")
-        if not content_elem:
-            # Final fallback to article
-            content_elem = soup.select_one("article")
-        content = str(content_elem) if content_elem else ""
-
-        # Process images before converting to markdown
-        print(f"Processing images for: {title}")
-        content = await self.process_images_in_content(content, title, date)
-
-        md = self.html_to_md(content)
+        # Content extraction - the body markup, else all of available-content, else the whole article
+        content_elem = next(filter(None, (selector.select_one(soup) for selector in _CONTENT_ELEMENT_SELECTORS)), None)
+
+        # Process images before converting to markdown, directly on the parsed element
+        logger.debug("Processing images for: %s", title)
+        if content_elem:
+            await self._localize_images(content_elem, title, date)
+
+        # Serializing the element and html-to-markdown are the heaviest CPU steps per post; run them off the event
+        # loop so other posts keep fetching
+        md = await asyncio.to_thread(self._element_to_md, content_elem)
         md_content = self.combine_metadata_and_content(title, subtitle, date, like_count, md)
         return title, subtitle, like_count, date, md_content
 
@@ -626,128 +1222,31 @@ class BaseSubstackScraper(ABC):
             if soup is None:
                 return None
 
-            # Extract date for filename
-            date_str = "1970-01-01"
-            date_selectors = [
-                # Very specific selector for the date div in byline-wrapper
-                # Target the date-containing div that has classes like 'color-pub-secondary-text-*'
-                "div.byline-wrapper div[class*='color-pub-secondary-text'] > div",
-                # More specific: the innermost div that contains the date text
-                "div.byline-wrapper div.pencraft.pc-display-flex.pc-gap-4 div[class*='color-pub-secondary-text']",
-                # Even more specific: look for div with date-like classes
-                "div[class*='date'][class*='pub-secondary']",
-                # Time elements with datetime attribute
-                "time[datetime]",  # Time elements with datetime
-                "article time[datetime]",  # Time in article with datetime
-                "div.post-header time[datetime]",  # Time in post header
-                # Text-based selectors as fallback
-                "span.post-meta-date",
-                "div.post-date",
-                "div.post-meta time",
-                "span[class*='date']",
-            ]
-
-            extracted_date = None
-            for selector in date_selectors:
-                date_elem = soup.select_one(selector)
-                if date_elem:
-                    # Try to get datetime attribute first
-                    date_attr = date_elem.get("datetime")
-                    if date_attr and str(date_attr) != "None":
-                        extracted_date = str(date_attr)
-                        print(f"  Date found from datetime attribute: {extracted_date}")
-                        break
-                    else:
-                        # Check if this element has child divs that might contain the actual date
-                        child_divs = date_elem.find_all("div")
-                        if child_divs:
-                            # Try to get the innermost div that contains text
-                            for child in child_divs:
-                                child_text = child.get_text(strip=True)
-                                # Check if this looks like a date
-                                if child_text and any(
-                                    month in child_text
-                                    for month in [
-                                        "Jan",
-                                        "Feb",
-                                        "Mar",
-                                        "Apr",
-                                        "May",
-                                        "Jun",
-                                        "Jul",
-                                        "Aug",
-                                        "Sep",
-                                        "Oct",
-                                        "Nov",
-                                        "Dec",
-                                    ]
-                                ):
-                                    # Check if this div has no children with text (i.e., it's the innermost)
-                                    if not child.find_all(text=True, recursive=False)[1:]:  # [1:] to skip its own text
-                                        extracted_date = child_text
-                                        print(f"  Date extracted from innermost div: {extracted_date}")
-                                        break
-
-                        # If we didn't find it in child divs, try the original element
-                        if not extracted_date:
-                            raw_text = date_elem.text.strip()
-                            if raw_text and raw_text != "None":
-                                # Clean up the text - remove author names and extra content
-                                # Split by common separators and look for date patterns
-                                parts = raw_text.split("∙")
-                                for part in parts:
-                                    # Check if this part looks like a date
-                                    if any(
-                                        month in part
-                                        for month in [
-                                            "Jan",
-                                            "Feb",
-                                            "Mar",
-                                            "Apr",
-                                            "May",
-                                            "Jun",
-                                            "Jul",
-                                            "Aug",
-                                            "Sep",
-                                            "Oct",
-                                            "Nov",
-                                            "Dec",
-                                        ]
-                                    ):
-                                        extracted_date = part.strip()
-                                        print(f"  Date extracted from text: {extracted_date}")
-                                        break
-                                else:
-                                    # If no month found, use the first part that contains numbers
-                                    for part in parts:
-                                        if any(char.isdigit() for char in part):
-                                            extracted_date = part.strip()
-                                            print(f"  Date extracted from text: {extracted_date}")
-                                            break
-
-                        if extracted_date:
-                            break
+            # Extract post data; its byline date also names the files
+            title, subtitle, like_count, date, md = await self.extract_post_data(soup, url)
+            # Only the extracted strings are needed from here on. The parse tree is full of parent/child cycles,
+            # so break it up now instead of waiting for the cycle collector while the HTML is rendered and written
+            soup.decompose()
+            del soup
 
             # Parse the extracted date to create filename
-            if extracted_date and extracted_date != "Date not found":
+            date_str = "1970-01-01"
+            if date != "Date not found":
                 try:
-                    # Use dateparser for robust date parsing
-                    parsed_date = dateparser.parse(extracted_date, settings={"PREFER_DAY_OF_MONTH": "first"})
+                    # Try the common formats first, then fall back to dateparser for robust date parsing
+                    parsed_date = parse_date_fast(date) or _parse_date_slow(date)
                     if parsed_date:
                         date_str = parsed_date.strftime("%Y%m%d")
                     else:
-                        print(f"  Warning: dateparser could not parse date '{extracted_date}'")
+                        print(f"  Warning: dateparser could not parse date '{date}'")
                         date_str = "19700101"
                 except Exception as e:
-                    print(f"  Warning: Error parsing date '{extracted_date}': {e}")
+                    print(f"  Warning: Error parsing date '{date}': {e}")
                     date_str = "19700101"
 
             # Use the parsed date string as the prefix
             date_prefix = date_str if date_str != "1970-01-01" else "19700101"
 
-            # Extract post data
-            title, subtitle, like_count, date, md = await self.extract_post_data(soup, url)
-
             # Generate date-based filename
             base_filename = self.get_filename_from_url(url, filetype="")
             md_filename = f"{date_prefix}-{base_filename}.md"
@@ -756,12 +1255,13 @@ class BaseSubstackScraper(ABC):
             md_filepath = os.path.join(self.md_save_dir, md_filename)
             html_filepath = os.path.join(self.html_save_dir, html_filename)
 
-            # Save files
-            await self.save_to_file(md_filepath, md)
-
-            # Convert markdown to HTML and save
-            html_content = self.md_to_html(md)
-            await self.save_to_html_file(html_filepath, html_content)
+            # Convert markdown to HTML off the event loop, then save both files in a single thread hop
+            html_content = await asyncio.to_thread(self.md_to_html, md)
+            html_page = self.build_html_page(html_filepath, html_content)
+            if not await asyncio.to_thread(_write_post_files, md_filepath, md, html_filepath, html_page):
+                print(f"File already exists: {md_filepath}")
+            if self._existing_slugs is not None:
+                self._existing_slugs.add(self.get_url_slug_from_url(url))
 
             return {
                 "title": title,
@@ -781,30 +1281,22 @@ class BaseSubstackScraper(ABC):
     async def save_essays_data_to_json(self, essays_data: list[dict[str, Any]]) -> None:
         """Saves essays data to JSON file."""
         data_dir = os.path.join(JSON_DATA_DIR)
-        os.makedirs(data_dir, exist_ok=True)
+        if not self._json_dir_ready:
+            os.makedirs(data_dir, exist_ok=True)
+            self._json_dir_ready = True
 
         json_path = os.path.join(data_dir, f"{self.writer_name}.json")
-        existing_data: list[dict[str, Any]] = []
-
-        if os.path.exists(json_path):
-            async with aiofiles.open(json_path, encoding="utf-8") as file:
-                content = await file.read()
-                loaded_data = json.loads(content)
-                if isinstance(loaded_data, list):
-                    existing_data = loaded_data  # type: ignore
+        await asyncio.to_thread(_merge_essays_file, json_path, essays_data)
 
-        # Merge with existing data
-        merged_data: list[dict[str, Any]] = existing_data + [data for data in essays_data if data not in existing_data]
-
-        async with aiofiles.open(json_path, "w", encoding="utf-8") as file:
-            await file.write(json.dumps(merged_data, ensure_ascii=False, indent=4))
-
-    async def scrape_posts(self, num_posts_to_scrape: int = 0, continuous: bool = False) -> None:
+    async def scrape_posts(
+        self, num_posts_to_scrape: int = 0, continuous: bool = False, max_concurrent: int | None = None
+    ) -> None:
         """Scrapes posts asynchronously and saves them with date-based filenames.
 
         Args:
             num_posts_to_scrape: Number of posts to scrape (0 for all)
             continuous: If True, only scrape new posts since last run
+            max_concurrent: Posts scraped at the same time (defaults to the class's max_concurrent)
         """
         print(f"Starting async scraping of posts from {self.base_substack_url}")
 
@@ -813,8 +1305,13 @@ class BaseSubstackScraper(ABC):
             print("No posts found to scrape. The domain might be unreachable or have no content.")
             return
 
-        # Load previous state
-        state = self.load_scraping_state() if continuous else {}
+        # Load previous state in a worker thread while the existing files are scanned
+        state_task = asyncio.create_task(asyncio.to_thread(self.load_scraping_state)) if continuous else None
+
+        # Get existing URLs from files
+        existing_urls = self._get_existing_urls_from_files()
+
+        state = await state_task if state_task else {}
         scraped_urls = set(state.get("scraped_urls", []))
         scraped_slugs = set(state.get("scraped_slugs", []))  # New: track URL slugs for better matching
         latest_date = state.get("latest_post_date")
@@ -822,59 +1319,23 @@ class BaseSubstackScraper(ABC):
         if continuous and latest_date:
             print(f"Continuous mode: Only fetching posts newer than {latest_date}")
 
-        # Get existing URLs from files
-        existing_urls = self._get_existing_urls_from_files()
-
         # Filter URLs - improved logic for continuous fetching with date-prefixed filenames
         urls_to_process = self.post_urls[:num_posts_to_scrape] if num_posts_to_scrape else self.post_urls
-        filtered_urls = []
 
         print(f"Filtering {len(urls_to_process)} URLs...")
         print(f"Continuous mode: {continuous}")
         print(f"Found {len(existing_urls)} existing URL slugs")
         print(f"Found {len(scraped_urls)} previously scraped URLs")
 
-        for url in urls_to_process:
-            # Use consistent URL slug extraction
-            url_slug = self.get_url_slug_from_url(url)
-            original_filename = self.get_filename_from_url(url, filetype=".md")
-
-            # In continuous mode, check both scraped URLs and existing files
-            if continuous:
-                # Check if URL was already scraped (from state file)
-                if url in scraped_urls:
-                    print(f"  Skipping URL already in scraped_urls: {url}")
-                    continue
-
-                # Check if URL slug was already scraped (more reliable for date-prefixed files)
-                if url_slug in scraped_slugs:
-                    print(f"  Skipping URL slug already in scraped_slugs: {url_slug}")
-                    continue
-
-                # Check if file already exists (by URL slug)
-                if url_slug in existing_urls:
-                    print(f"  Skipping URL with existing file: {url_slug}")
-                    continue
-
-                print(f"  ✓ New URL for continuous mode: {url_slug}")
-
-            # In non-continuous mode, check for existing files more thoroughly
-            else:
-                old_filepath = os.path.join(self.md_save_dir, original_filename)
-
-                # Check for exact filename match (old format)
-                if os.path.exists(old_filepath):
-                    print(f"  File already exists (old format): {original_filename}")
-                    continue
-
-                # Check if URL slug exists in any date-prefixed file
-                if url_slug in existing_urls:
-                    print(f"  File already exists (date-prefixed): {url_slug}")
-                    continue
-
-                print(f"  ✓ New URL for regular mode: {url_slug}")
-
-            filtered_urls.append(url)
+        # existing_urls covers both date-prefixed and old-format files; continuous mode also skips
+        # anything recorded in the state file (scraped_urls/scraped_slugs are empty otherwise)
+        blocked_slugs = existing_urls | scraped_slugs
+        filtered_urls = [
+            url
+            for url in urls_to_process
+            if url not in scraped_urls and self.get_url_slug_from_url(url) not in blocked_slugs
+        ]
+        logger.debug("Skipping %d already scraped URLs", len(urls_to_process) - len(filtered_urls))
 
         if not filtered_urls:
             print("No new posts to scrape.")
@@ -882,51 +1343,83 @@ class BaseSubstackScraper(ABC):
 
         print(f"Found {len(filtered_urls)} posts to scrape")
 
-        # Process URLs sequentially to avoid concurrent issues
         essays_data = []
-        with tqdm(total=len(filtered_urls), desc="Scraping posts") as pbar:
-            for url in filtered_urls:
-                # Add random delay to be respectful
-                delay = random.uniform(self.delay_range[0], self.delay_range[1])
-                await asyncio.sleep(delay)
-
-                result = await self.scrape_single_post_with_date(url)
-
-                # In continuous mode, check if the scraped post is older than our latest date
-                # This is a final check after scraping to ensure we don't save old posts
-                if result and continuous and latest_date:
-                    if result["date_str"] <= latest_date:
-                        print(f"  Skipping older post after scraping (date: {result['date_str']} <= {latest_date})")
-                        pbar.update(1)
-                        continue
-
-                if result:
-                    essays_data.append(result)
-                    scraped_urls.add(result["url"])
-                    scraped_slugs.add(
-                        self.get_url_slug_from_url(result["url"])
-                    )  # Track URL slugs for better matching
+        latest_post: dict[str, Any] | None = None
+
+        def record(result: dict[str, Any] | None) -> None:
+            nonlocal latest_post
+            if not result:
+                return
+
+            # In continuous mode, check if the scraped post is older than our latest date
+            # This is a final check after scraping to ensure we don't save old posts
+            if continuous and latest_date and result["date_str"] <= latest_date:
+                logger.debug("Skipping older post after scraping (date: %s <= %s)", result["date_str"], latest_date)
+                return
+
+            essays_data.append(result)
+            if latest_post is None or result.get("date_str", "") > latest_post.get("date_str", ""):
+                latest_post = result
+            if result.get("url"):
+                scraped_urls.add(result["url"])
+                scraped_slugs.add(self.get_url_slug_from_url(result["url"]))  # Track URL slugs for better matching
+
+        # A fixed pool of max_concurrent workers pulls URLs from a queue, so only that many coroutines exist
+        # however large the archive is; the scraper's pacer spaces out page loads across all of them
+        url_queue: asyncio.Queue[str] = asyncio.Queue()
+        for url in filtered_urls:
+            url_queue.put_nowait(url)
+
+        async def worker(pbar: tqdm) -> None:
+            while True:
+                try:
+                    url = url_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                # Respect the delay between requests across workers rather than per worker
+                await self._pacer.wait(self.delay_range)
+                try:
+                    result = await self.scrape_single_post_with_date(url)
+                except Exception as e:  # One bad post must not stop the other workers
+                    print(f"Error scraping post {url}: {e}")
+                    result = None
+                record(result)
                 pbar.update(1)
 
-        # Save data and update state
-        if essays_data:
-            await self.save_essays_data_to_json(essays_data)
-            print(f"✓ Scraped {len(essays_data)} posts successfully")
-
-            # Update state for continuous mode
-            if continuous:
-                latest_post = max(essays_data, key=lambda x: x.get("date_str", ""))
-                new_state = {
-                    "latest_post_date": latest_post.get("date_str", ""),
-                    "latest_post_url": latest_post.get("url", ""),
-                    "scraped_urls": list(scraped_urls),
-                    "scraped_slugs": list(
-                        scraped_slugs
-                    ),  # Include URL slugs for better matching with date-prefixed files
-                    "last_update": datetime.now().isoformat(),
-                }
-                await self.save_scraping_state(new_state)
-                print(f"✓ Updated state with {len(scraped_slugs)} URL slugs for continuous mode")
+        completed = False
+        try:
+            with tqdm(total=len(filtered_urls), desc="Scraping posts") as pbar:
+                workers = min(max_concurrent or self.max_concurrent, len(filtered_urls))
+                await asyncio.gather(*(worker(pbar) for _ in range(workers)))
+            completed = True
+        finally:
+            # Also runs when the run is interrupted (Ctrl+C, a crash): the posts finished so far are already on
+            # disk and the next run skips them, so their metadata has to be saved now or it is never recorded
+            if essays_data:
+                if not completed:
+                    print(f"Interrupted, saving the {len(essays_data)} posts scraped so far")
+                await self.save_essays_data_to_json(essays_data)
+                print(f"✓ Scraped {len(essays_data)} posts successfully")
+
+                # Update state for continuous mode
+                if continuous and latest_post:
+                    # An interrupted run may not have reached older posts yet, so it keeps the previous latest
+                    # post: otherwise the next run would drop them as older than this run's newest
+                    if completed:
+                        newest_date, newest_url = latest_post.get("date_str", ""), latest_post.get("url", "")
+                    else:
+                        newest_date, newest_url = latest_date or "", state.get("latest_post_url", "")
+                    new_state = {
+                        "latest_post_date": newest_date,
+                        "latest_post_url": newest_url,
+                        "scraped_urls": list(scraped_urls),
+                        "scraped_slugs": list(
+                            scraped_slugs
+                        ),  # Include URL slugs for better matching with date-prefixed files
+                        "last_update": datetime.now().isoformat(),
+                    }
+                    await self.save_scraping_state(new_state)
+                    print(f"✓ Updated state with {len(scraped_slugs)} URL slugs for continuous mode")
 
         # Generate HTML file
         await generate_html_file(self.writer_name)
@@ -935,6 +1428,9 @@ class BaseSubstackScraper(ABC):
 class PydollSubstackScraper(BaseSubstackScraper):
     """Pydoll-based Substack scraper with async support."""
 
+    # All navigation goes through a single browser tab
+    max_concurrent = 1
+
     def __init__(
         self,
         base_substack_url: str,
@@ -945,16 +1441,292 @@ class PydollSubstackScraper(BaseSubstackScraper):
         user_agent: str = "",
         delay_range: tuple[int, int] = (1, 3),
         manual_login: bool = False,
+        block_resources: bool = True,
+        profile_dir: str = "",
     ):
         super().__init__(base_substack_url, md_save_dir, html_save_dir, delay_range)
         self.headless = headless
+        self.profile_dir = profile_dir
+        self.block_resources = block_resources
         self.browser_path = browser_path
         self.user_agent = user_agent
         self.browser = None
         self.tab = None
         self.auth_token = None
-        self.is_logged_in = False
+        # Kept in one object so the tab views of scrape_posts_concurrently (shallow copies) share it with this scraper
+        self._login_state = _LoginState()
         self.manual_login = manual_login
+        self._page_source_cache: dict[str, bytes] = {}
+        self._current_url: str | None = None
+        self._analytics_flags_cache: tuple[bytes, dict[str, bool]] | None = None
+        # Set by scrape_posts_concurrently: per-tab views of this scraper that posts are dispatched to
+        self._tab_pool: asyncio.Queue[PydollSubstackScraper] | None = None
+
+    @property
+    def is_logged_in(self) -> bool:
+        """Whether the browser session is logged in to Substack, as seen by every tab view."""
+        return self._login_state.is_logged_in
+
+    @is_logged_in.setter
+    def is_logged_in(self, value: bool) -> None:
+        self._login_state.is_logged_in = value
+
+    @property
+    def _session_restored(self) -> bool:
+        """Whether the login came from saved session cookies rather than a fresh sign-in."""
+        return self._login_state.session_restored
+
+    @_session_restored.setter
+    def _session_restored(self, value: bool) -> None:
+        self._login_state.session_restored = value
+
+    def retarget(self, base_substack_url: str) -> None:
+        """Point the scraper at a Substack and load its record of paywalled posts."""
+        super().retarget(base_substack_url)
+        self.paywall_skip = self.load_paywall_skip()
+
+    def load_paywall_skip(self) -> dict[str, float]:
+        """Load the {url: timestamp} record of posts that could not get past the paywall."""
+        skip_file = os.path.join(self.md_save_dir, ".paywall_skip.json")
+        if os.path.exists(skip_file):
+            try:
+                return _read_json_file(skip_file)
+            except Exception as e:
+                print(f"Error loading paywall skip list: {e}")
+        return {}
+
+    async def remember_paywalled(self, url: str) -> None:
+        """Record that url is still paywalled after logging in, so runs within PAYWALL_SKIP_TTL skip it."""
+        self.paywall_skip[url] = time.time()
+        skip_file = os.path.join(self.md_save_dir, ".paywall_skip.json")
+        try:
+            # A copy, since other tabs may record posts while the thread serializes it
+            await asyncio.to_thread(_write_json_file, skip_file, dict(self.paywall_skip))
+        except Exception as e:
+            print(f"Error saving paywall skip list: {e}")
+
+    def load_session_cookies(self) -> list[dict[str, Any]] | None:
+        """Cookies saved by an earlier successful login, or None if there are none younger than SESSION_COOKIE_TTL."""
+        try:
+            if time.time() - os.path.getmtime(SESSION_COOKIE_FILE) >= SESSION_COOKIE_TTL:
+                return None
+            cookies = _read_json_file(SESSION_COOKIE_FILE)
+        except (OSError, ValueError):
+            return None
+        return cookies if isinstance(cookies, list) and cookies else None
+
+    async def restore_session_cookies(self) -> bool:
+        """Load the saved login cookies into the browser before any navigation. Returns True if there were any."""
+        cookies = self.load_session_cookies()
+        if not cookies:
+            return False
+
+        params = []
+        for cookie in cookies:
+            param = {key: cookie[key] for key in _COOKIE_PARAM_KEYS if key in cookie}
+            if not cookie.get("session") and cookie.get("expires", -1) > 0:
+                param["expires"] = cookie["expires"]
+            params.append(param)
+        try:
+            await self.tab.set_cookies(params)
+        except Exception as e:
+            print(f"  Could not restore saved login session: {e}")
+            return False
+
+        self._session_restored = True
+        return True
+
+    async def save_session_cookies(self) -> None:
+        """Save the browser's cookies after a successful login so later runs can skip logging in."""
+        try:
+            cookies = await self.tab.get_cookies()
+            await asyncio.to_thread(_write_private_file, SESSION_COOKIE_FILE, _dump_json_bytes(cookies))
+        except Exception as e:
+            print(f"Error saving login session: {e}")
+
+    def forget_session_cookies(self) -> None:
+        """Drop saved login cookies that turned out to be expired."""
+        self._session_restored = False
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(SESSION_COOKIE_FILE)
+
+    def is_known_paywalled(self, url: str) -> bool:
+        """Whether url was found paywalled within the last PAYWALL_SKIP_TTL seconds."""
+        recorded = self.paywall_skip.get(url)
+        return recorded is not None and time.time() - recorded < PAYWALL_SKIP_TTL
+
+    def _invalidate_page_cache(self) -> None:
+        """Forget the cached URL and page source, e.g. after a click that may have changed the page."""
+        self._page_source_cache.clear()
+        self._current_url = None
+
+    async def _go_to(self, url: str) -> None:
+        """Navigate the tab to url, dropping any page source cached for the previous page."""
+        self._invalidate_page_cache()
+        await self.tab.go_to(url)
+        self._current_url = url
+
+    async def _current_page_url(self) -> str:
+        """Return the tab's URL, asking the browser only if it is unknown since the last navigation or click."""
+        if self._current_url is None:
+            self._current_url = await self.tab.current_url
+        return self._current_url
+
+    async def _get_page_source_cached(self, refresh: bool = False) -> bytes:
+        """Return the current page source as UTF-8 bytes, fetching it over CDP at most once per URL.
+
+        Pass refresh=True when the DOM may have changed since the last fetch (e.g. lazy-loaded content).
+        """
+        url = await self._current_page_url()
+        if refresh or url not in self._page_source_cache:
+            source = await self.tab.page_source
+            self._page_source_cache = {url: source.encode("utf-8", "ignore")}
+        return self._page_source_cache[url]
+
+    def _release_page_source(self) -> None:
+        """Drop the cached page source once it is handed to the parser.
+
+        The soup supersedes the raw bytes: clearing the cache (and the analytics memo, which holds the same bytes)
+        leaves the parser's reference as the only copy, freed as soon as the parse is done.
+        """
+        self._page_source_cache.clear()
+        self._analytics_flags_cache = None
+
+    async def _wait_for_js(self, cond_js: str, timeout: float) -> bool:
+        """Poll a JS condition until it is true, returning False if it still isn't after timeout seconds."""
+        script = f"(() => !!({cond_js}))()"
+
+        async def poll() -> None:
+            while True:
+                try:
+                    if await self._evaluate(script):
+                        return
+                except Exception as e:  # e.g. execution context destroyed mid-navigation
+                    logger.debug("Condition check failed: %s", e)
+                await asyncio.sleep(_WAIT_POLL_INTERVAL)
+
+        try:
+            await asyncio.wait_for(poll(), timeout)
+            return True
+        except TimeoutError:
+            return False
+
+    async def _wait_for_stable_content(self, timeout: float) -> bool:
+        """Wait until the post body's HTML length is the same in two consecutive samples (False on timeout)."""
+
+        async def poll() -> None:
+            previous = None
+            while True:
+                try:
+                    size = await self._evaluate(_CONTENT_SIZE_JS)
+                except Exception as e:
+                    logger.debug("Content size check failed: %s", e)
+                    size = None
+                if size is not None and size >= 0 and size == previous:
+                    return
+                previous = size
+                await asyncio.sleep(_STABILITY_POLL_INTERVAL)
+
+        try:
+            await asyncio.wait_for(poll(), timeout)
+            return True
+        except TimeoutError:
+            return False
+
+    async def _wait_for_content(self, timeout: float) -> str | None:
+        """Poll for the post's content container, returning the name of the first one found or None on timeout.
+
+        Only the name is needed, so unlike _find_first no element is tagged and fetched afterwards.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                name = await self._evaluate(_CONTENT_MATCH_JS)
+            except Exception as e:  # e.g. execution context destroyed mid-navigation
+                logger.debug("Content check failed: %s", e)
+                name = None
+            if isinstance(name, str):
+                return name
+            if time.monotonic() >= deadline:
+                return None
+            await asyncio.sleep(_WAIT_POLL_INTERVAL)
+
+    async def _evaluate(self, script: str) -> Any:
+        """Evaluate a script in the page and return its (primitive) result value."""
+        response = await self.tab.execute_script(script)
+        return response.get("result", {}).get("result", {}).get("value")
+
+    async def _find_first(self, probes: list[tuple[str, str, str]], timeout: float = 3) -> tuple[str | None, Any]:
+        """Find the first element matching any (name, css selector, text) probe.
+
+        All probes are checked in a single script evaluation per poll, instead of one CDP call
+        (and one timeout) per probe. Returns (probe name, element) or (None, None).
+        """
+        return await self._poll_for_match(_FIRST_MATCH_JS % json.dumps(probes), timeout)
+
+    async def _poll_for_match(self, script: str, timeout: float) -> tuple[str | None, Any]:
+        """Evaluate a tagging script until it reports a match name (or timeout), then fetch the tagged element."""
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                name = await self._evaluate(script)
+                if isinstance(name, str):
+                    element = await self.tab.query(f"[data-substack2md-match='{name}']", raise_exc=False)
+                    if element:
+                        return name, element
+            except Exception as e:  # e.g. execution context destroyed mid-navigation
+                logger.debug("Match check failed: %s", e)
+            if time.monotonic() >= deadline:
+                return None, None
+            await asyncio.sleep(_PROBE_POLL_INTERVAL)
+
+    async def _first_hit(self, methods: list[tuple[str, Callable[[], Awaitable[Any]]]]) -> tuple[str | None, Any]:
+        """Run all (name, probe) methods concurrently and return the first truthy (name, result).
+
+        Worst-case latency is the slowest probe's timeout rather than the sum of all of them.
+        Remaining probes are cancelled once a hit is found. Returns (None, None) if nothing hits.
+        """
+
+        async def run(name: str, method: Callable[[], Awaitable[Any]]) -> tuple[str, Any]:
+            try:
+                return name, await method()
+            except Exception as e:
+                logger.debug("Failed %s: %s", name, e)
+                return name, None
+
+        tasks = [asyncio.create_task(run(name, method)) for name, method in methods]
+        try:
+            for future in asyncio.as_completed(tasks):
+                name, result = await future
+                if result:
+                    return name, result
+            return None, None
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _find_login_form(self, timeout: float = 3) -> dict[str, Any]:
+        """Locate the email, password and submit controls of the sign-in form in one DOM walk.
+
+        Polls until an email input shows up (or timeout) and returns a role -> element mapping.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                found = await self._evaluate(_LOGIN_FORM_JS)
+                roles = found.split(",") if isinstance(found, str) and found else []
+                if "email" in roles or time.monotonic() >= deadline:
+                    elements: dict[str, Any] = {}
+                    for role in roles:
+                        element = await self.tab.query(f"[data-substack2md-role='{role}']", raise_exc=False)
+                        if element:
+                            elements[role] = element
+                    return elements
+            except Exception as e:  # e.g. execution context destroyed mid-navigation
+                logger.debug("Login form lookup failed: %s", e)
+            if time.monotonic() >= deadline:
+                return {}
+            await asyncio.sleep(_PROBE_POLL_INTERVAL)
 
     async def initialize_browser(self):
         """Initialize Pydoll browser with options."""
@@ -969,6 +1741,12 @@ class PydollSubstackScraper(BaseSubstackScraper):
         if self.user_agent:
             options.add_argument(f"user-agent={self.user_agent}")
 
+        # A persistent profile carries cookies, the HTTP cache and Cloudflare clearance over to the next run
+        # (without one, Pydoll starts every browser with an empty temporary profile)
+        if self.profile_dir:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            options.add_argument(f"--user-data-dir={self.profile_dir}")
+
         # Performance optimizations
         options.add_argument("--disable-blink-features=AutomationControlled")
         options.add_argument("--disable-notifications")
@@ -976,25 +1754,19 @@ class PydollSubstackScraper(BaseSubstackScraper):
 
         self.browser = Chrome(options=options)
         self.tab = await self.browser.start()
-
-        # Enable network events for monitoring
-        await self.tab.enable_network_events()
-
-        # Resource blocking temporarily disabled
-        # await self.setup_resource_blocking()
-
-    # Resource blocking temporarily disabled - imports not available in current Pydoll version
-    # async def setup_resource_blocking(self):
-    #     """Set up resource blocking for faster page loads."""
-    #     # Block images, fonts, and media
-    #     for resource_type in [ResourceType.IMAGE, ResourceType.FONT, ResourceType.MEDIA]:
-    #         await self.tab.enable_fetch_events(resource_type=resource_type)
-    #
-    #     async def block_resources(tab, event):
-    #         request_id = event["params"]["requestId"]
-    #         await self.browser.fail_request(request_id, NetworkErrorReason.BLOCKED_BY_CLIENT)
-    #
-    #     await self.tab.on(FetchEvent.REQUEST_PAUSED, partial(block_resources, self.tab))
+        self._invalidate_page_cache()
+        await self._prepare_tab(self.tab)
+
+    async def _prepare_tab(self, tab) -> None:
+        """Set up a new tab: network events, Cloudflare auto-solve and, unless disabled, resource blocking."""
+        # Enable network events for monitoring (also required for Network.setBlockedURLs)
+        await tab.enable_network_events()
+        # Solve Cloudflare captchas on every page load in the background. Wrapping each navigation in
+        # expect_and_bypass_cloudflare_captcha() re-enabled page events for every post and held up go_to
+        # until the captcha lookup gave up (5s) on pages without one
+        await tab.enable_auto_solve_cloudflare_captcha()
+        if self.block_resources:
+            await tab._execute_command(NetworkCommands.set_blocked_urls(_BLOCKED_URL_PATTERNS))
 
     async def login(self) -> None:
         """Login to Substack using Pydoll."""
@@ -1008,14 +1780,14 @@ class PydollSubstackScraper(BaseSubstackScraper):
         print("Logging in to Substack...")
 
         # Navigate to login page
-        await self.tab.go_to("https://substack.com/sign-in")
-        await asyncio.sleep(2)  # Wait for page load - keeping reasonable timeout
+        await self._go_to("https://substack.com/sign-in")
+        await self._wait_for_js(_LOGIN_FORM_READY_JS, timeout=2)  # Wait for the sign-in form to render
 
         # Perform the login
         await self.perform_login_on_page()
 
-        # After login, wait and verify - reduced timeout to avoid blocking too long
-        await asyncio.sleep(3)  # Reduced from 5s to 3s as per CLAUDE.md guidance
+        # After login, wait for the redirect (or an error) - at most as long as the old fixed 3s sleep
+        await self._wait_for_js(_LOGIN_SETTLED_JS, timeout=3)
 
         # Check if we're logged in by looking for common logged-in elements
         current_url = await self.tab.current_url
@@ -1029,25 +1801,22 @@ class PydollSubstackScraper(BaseSubstackScraper):
             login_success = True
             print("  ✓ Redirected away from sign-in page")
 
-        # Method 2: Check for user menu or dashboard elements
+        # Method 2: Check for user menu or dashboard elements, all in one page evaluation
         if not login_success:
-            user_menu = await self.tab.find(class_name="user-menu", timeout=5, raise_exc=False)
-            dashboard_link = await self.tab.find(text="Dashboard", timeout=5, raise_exc=False)
-            home_title = await self.tab.find(tag_name="h1", text="Home", timeout=5, raise_exc=False)
-
-            if user_menu or dashboard_link or home_title:
+            indicator, _ = await self._find_first(_LOGIN_INDICATOR_PROBES, timeout=_PROBE_TIMEOUT)
+            if indicator:
                 login_success = True
                 print("  ✓ Found logged-in user elements")
 
-        # Check for error messages
-        error_container = await self.tab.find(id="error-container", timeout=5, raise_exc=False)
-        if error_container:
-            error_text = await error_container.text
+        # Check for error messages (the settle wait above already gave it time to appear)
+        error_text = await self._evaluate(_LOGIN_ERROR_JS)
+        if error_text is not None:
             raise Exception(f"Login failed: {error_text}")
 
         if login_success:
             self.is_logged_in = True
             print("✓ Login successful!")
+            await self.save_session_cookies()
         else:
             # If we're still on sign-in page but no error, might be 2FA or other prompt
             if "sign-in" in current_url:
@@ -1064,107 +1833,56 @@ class PydollSubstackScraper(BaseSubstackScraper):
                 # Password field not visible, look for "Sign in with password" element
                 print("  Password field not visible, looking for 'Sign in with password' element...")
 
-                # Try multiple selectors to find the "Sign in with password" element
-                sign_in_password_element = None
-
-                # Method 1: Find by class and text
-                try:
-                    sign_in_password_element = await self.tab.find(
-                        tag_name="a",
-                        class_name="login-option",
-                        text="Sign in with password",
-                        timeout=3,
-                        raise_exc=False,
-                    )
-                except:
-                    pass
-
-                # Method 2: Find by CSS selector
-                if not sign_in_password_element:
-                    try:
-                        elements = await self.tab.query_selector_all("a.login-option.substack-login__login-option")
-                        for element in elements:
-                            text_content = await element.text_content()
-                            if "Sign in with password" in text_content:
-                                sign_in_password_element = element
-                                break
-                    except:
-                        pass
-
-                # Method 3: Find by href and text content
-                if not sign_in_password_element:
-                    try:
-                        elements = await self.tab.query_selector_all("a[href='javascript:void(0)']")
-                        for element in elements:
-                            text_content = await element.text_content()
-                            if "Sign in with password" in text_content:
-                                sign_in_password_element = element
-                                break
-                    except:
-                        pass
+                # Check the login-option link and the javascript:void(0) link fallback in one DOM walk per poll
+                _, sign_in_password_element = await self._find_first(
+                    [
+                        ("login_option", "a.login-option", "Sign in with password"),
+                        ("void_link", "a[href='javascript:void(0)']", "Sign in with password"),
+                    ],
+                    timeout=3,
+                )
 
                 if sign_in_password_element:
                     print("  Found 'Sign in with password' element, clicking...")
                     await sign_in_password_element.click()
-                    await asyncio.sleep(3)  # Wait for the form to update
+                    # Wait for the form to update: returns as soon as the password field is there, at most 3s
+                    password_verify = await self._wait_for_js(_PASSWORD_FIELD_READY_JS, timeout=3)
                     print("  ✓ Clicked 'Sign in with password' element")
 
                     # Verify password field appeared after clicking
-                    password_verify = await self.tab.find(tag_name="input", name="password", timeout=5, raise_exc=False)
                     if password_verify:
                         print("  ✓ Password field is now visible!")
                     else:
                         print("  ⚠️ Password field still not visible after clicking")
                         # Try to debug what's on the page
                         try:
-                            form_action = await self.tab.query("form", timeout=2, raise_exc=False)
+                            form_action = await self.tab.query("form", raise_exc=False)
                             if form_action:
-                                action_attr = await form_action.get_attribute("action")
+                                action_attr = form_action.get_attribute("action")
                                 print(f"  Debug: Form action is now: {action_attr}")
                         except:
                             pass
                 else:
                     print("  ❌ No 'Sign in with password' element found with any method")
-                    # Debug: Let's see what elements are actually available
+                    # Debug: Let's see what elements are actually available (read in a single evaluation)
                     try:
-                        all_links = await self.tab.query_selector_all("a")
-                        print(f"  Debug: Found {len(all_links)} <a> elements on page")
-                        for i, link in enumerate(all_links[:5]):  # Show first 5
-                            try:
-                                text = await link.text_content()
-                                href = await link.get_attribute("href")
-                                classes = await link.get_attribute("class")
-                                print(f"    Link {i + 1}: text='{text}' href='{href}' class='{classes}'")
-                            except:
-                                pass
+                        links = json.loads(await self._evaluate(_LINKS_DEBUG_JS))
+                        print(f"  Debug: Found {links['count']} <a> elements on page")
+                        for i, link in enumerate(links["first"], 1):  # Show first 5
+                            print(f"    Link {i}: text='{link['text']}' href='{link['href']}' class='{link['class']}'")
                     except Exception as debug_e:
                         print(f"  Debug failed: {debug_e}")
             else:
                 print("  ✓ Password field is already visible, proceeding with login...")
 
-            # Find email input using sequential search for reliability
-            print("  Finding email input...")
-
-            # Try different email input detection methods sequentially
-            email_input = None
-            email_methods = [
-                ("type_email", lambda: self.tab.find(attrs={"type": "email"}, timeout=3, raise_exc=False)),
-                ("name_email", lambda: self.tab.find(attrs={"name": "email"}, timeout=3, raise_exc=False)),
-                ("placeholder_email", lambda: self.tab.find(attrs={"placeholder": "Email"}, timeout=3, raise_exc=False)),
-                ("css_email", lambda: self.tab.query("input[type='email']", timeout=3, raise_exc=False)),
-                ("class_email", lambda: self.tab.query("input.input-ZGrgg4", timeout=3, raise_exc=False)),
-                ("form_email", lambda: self.tab.query("form input[name='email']", timeout=3, raise_exc=False)),
-            ]
-
-            for method_name, method_func in email_methods:
-                try:
-                    email_input = await method_func()
-                    if email_input:
-                        print(f"  ✓ Found email input using {method_name}")
-                        break
-                except Exception as e:
-                    print(f"  Failed {method_name}: {e}")
-                    continue
+            # Find the email, password and submit controls in a single pass over the form
+            print("  Finding login form fields...")
+            form = await self._find_login_form(timeout=3)
+            email_input = form.get("email")
+            password_input = form.get("password")
+            submit_button = form.get("submit")
+            if form:
+                print(f"  ✓ Found login form fields: {', '.join(form)}")
 
             if email_input:
                 # Use insert_text which clears the field and inserts new text
@@ -1174,30 +1892,6 @@ class PydollSubstackScraper(BaseSubstackScraper):
             else:
                 raise Exception("Could not find email input field")
 
-            # Find password input using sequential search for reliability
-            print("  Finding password field...")
-
-            # Try different password input detection methods sequentially
-            password_input = None
-            password_methods = [
-                ("type_password", lambda: self.tab.find(attrs={"type": "password"}, timeout=3, raise_exc=False)),
-                ("name_password", lambda: self.tab.find(attrs={"name": "password"}, timeout=3, raise_exc=False)),
-                ("css_password", lambda: self.tab.query("input[type='password']", timeout=3, raise_exc=False)),
-                ("placeholder_password", lambda: self.tab.find(attrs={"placeholder": "Password"}, timeout=3, raise_exc=False)),
-                ("class_password", lambda: self.tab.query("input.input-ZGrgg4[type='password']", timeout=3, raise_exc=False)),
-                ("form_password", lambda: self.tab.query("form input[name='password']", timeout=3, raise_exc=False)),
-            ]
-
-            for method_name, method_func in password_methods:
-                try:
-                    password_input = await method_func()
-                    if password_input:
-                        print(f"  ✓ Found password input using {method_name}")
-                        break
-                except Exception as e:
-                    print(f"  Failed {method_name}: {e}")
-                    continue
-
             if password_input:
                 print("  Entering password...")
                 # Use insert_text which clears the field and inserts new text
@@ -1207,29 +1901,6 @@ class PydollSubstackScraper(BaseSubstackScraper):
             else:
                 print("  Warning: Password field not found, trying to submit with email only...")
 
-            # Find submit button using sequential search for reliability
-            print("  Finding submit button...")
-
-            # Try different submit button detection methods sequentially
-            submit_button = None
-            submit_methods = [
-                ("submit_type", lambda: self.tab.find(tag_name="button", attrs={"type": "submit"}, timeout=3, raise_exc=False)),
-                ("continue_text", lambda: self.tab.find(tag_name="button", text="Continue", timeout=3, raise_exc=False)),
-                ("signin_text", lambda: self.tab.find(tag_name="button", text="Sign in", timeout=3, raise_exc=False)),
-                ("form_submit", lambda: self.tab.query("form button[type='submit']", timeout=3, raise_exc=False)),
-                ("pencraft_button", lambda: self.tab.query("button.buttonBase-GK1x3M", timeout=3, raise_exc=False)),
-            ]
-
-            for method_name, method_func in submit_methods:
-                try:
-                    submit_button = await method_func()
-                    if submit_button:
-                        print(f"  ✓ Found submit button using {method_name}")
-                        break
-                except Exception as e:
-                    print(f"  Failed {method_name}: {e}")
-                    continue
-
             if submit_button:
                 print("  Clicking submit button...")
                 await submit_button.click()
@@ -1254,10 +1925,10 @@ class PydollSubstackScraper(BaseSubstackScraper):
         print("You will be able to login manually in the browser window.")
 
         # Navigate to login page
-        await self.tab.go_to("https://substack.com/sign-in")
+        await self._go_to("https://substack.com/sign-in")
 
         # Wait for page to load
-        await asyncio.sleep(2)
+        await self._wait_for_js("document.readyState === 'complete'", timeout=2)
 
         print("\n" + "=" * 60)
         print("MANUAL LOGIN MODE")
@@ -1266,137 +1937,75 @@ class PydollSubstackScraper(BaseSubstackScraper):
         print("2. Please login manually in the browser window")
         print("3. You can use any login method (email/password, Google, etc.)")
         print("4. Once you're logged in, press Enter to continue...")
+        print("   (or just wait: the login is detected automatically)")
         print("=" * 60)
 
-        # Pause for manual login
-        input("Press Enter after you have successfully logged in: ")
-
-        # Verify login by checking for common logged-in elements
-        print("Verifying login status...")
-
-        # Check multiple indicators of being logged in
-        # Try various selectors that indicate logged-in state
-
-        # Check for login indicators using sequential search for reliability
-        print("  Checking login status...")
-
-        # Try different login verification methods sequentially
-        login_methods = [
-            ("user_menu", lambda: self.tab.find(class_name="user-menu", timeout=2, raise_exc=False)),
-            ("avatar_button", lambda: self.tab.query("button.avatarButton-lZBlGB", timeout=2, raise_exc=False)),
-            ("dashboard_button", lambda: self.tab.find(text="Dashboard", timeout=2, raise_exc=False)),
-            ("reader_nav", lambda: self.tab.find(class_name="reader-nav-root", timeout=2, raise_exc=False)),
-            ("home_title", lambda: self.tab.find(tag_name="h1", text="Home", timeout=2, raise_exc=False)),
-            ("subscriber_elem", lambda: self.tab.query("[data-testid='subscriber-only']", timeout=2, raise_exc=False)),
-            ("signout_elem", lambda: self.tab.find(text="Sign out", timeout=2, raise_exc=False)),
-        ]
+        # Continue as soon as the page shows a logged-in indicator or the user presses Enter, whichever comes
+        # first; the prompt runs off the event loop so the browser connection stays serviced meanwhile
+        detect = asyncio.create_task(self._wait_for_login_indicator(MANUAL_LOGIN_TIMEOUT))
+        enter = _prompt_in_background("Press Enter after you have successfully logged in: ")
+        done, _ = await asyncio.wait({detect, enter}, return_when=asyncio.FIRST_COMPLETED)
+        if enter not in done:
+            enter.cancel()
+            print()  # End the unanswered prompt line
+
+        indicator = None
+        if detect in done:
+            indicator = detect.result()
+        else:
+            detect.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await detect
 
-        # Check each login indicator
-        user_menu = None
-        avatar_button = None
-        dashboard_button = None
-        reader_nav = None
-        home_title = None
-        subscriber_elem = None
-        signout_elem = None
+        if indicator is None:
+            # Verify login by checking all login indicators in one page evaluation
+            print("Verifying login status...")
+            indicator, _ = await self._find_first(_LOGIN_INDICATOR_PROBES, timeout=_PROBE_TIMEOUT)
 
-        for method_name, method_func in login_methods:
-            try:
-                result = await method_func()
-                if result:
-                    print(f"  ✓ Found login indicator: {method_name}")
-                    if method_name == "user_menu":
-                        user_menu = result
-                    elif method_name == "avatar_button":
-                        avatar_button = result
-                    elif method_name == "dashboard_button":
-                        dashboard_button = result
-                    elif method_name == "reader_nav":
-                        reader_nav = result
-                    elif method_name == "home_title":
-                        home_title = result
-                    elif method_name == "subscriber_elem":
-                        subscriber_elem = result
-                    elif method_name == "signout_elem":
-                        signout_elem = result
-            except Exception as e:
-                print(f"  Failed {method_name}: {e}")
-                continue
-
-        if (
-            user_menu
-            or avatar_button
-            or dashboard_button
-            or reader_nav
-            or home_title
-            or subscriber_elem
-            or signout_elem
-        ):
+        if indicator:
+            print(f"  ✓ Found login indicator: {indicator}")
             self.is_logged_in = True
             print("✓ Login verification successful!")
-            if dashboard_button or home_title:
+            await self.save_session_cookies()
+            if indicator in ("dashboard_button", "home_title"):
                 print("  (Detected Substack home page)")
         else:
             print("⚠ Warning: Could not verify login status. Continuing anyway...")
             print("If you encounter access issues with premium content, please try again.")
             self.is_logged_in = True  # Assume successful for manual mode
 
+    async def _wait_for_login_indicator(self, timeout: float) -> str | None:
+        """Poll for a logged-in indicator while the user logs in by hand; returns its name, or None on timeout.
+
+        Page errors from the login flow's navigations are ignored, and nothing is checked while the tab is still
+        on the sign-in page.
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                if "sign-in" not in await self.tab.current_url:
+                    indicator, _ = await self._find_first(_LOGIN_INDICATOR_PROBES, timeout=0)
+                    if indicator:
+                        return indicator
+            except Exception as e:  # e.g. execution context destroyed mid-navigation
+                logger.debug("Login indicator check failed: %s", e)
+            await asyncio.sleep(_MANUAL_LOGIN_POLL_INTERVAL)
+        return None
+
     async def handle_sign_in_button(self) -> bool:
         """Check for and click the Sign in button if present. Returns True if handled.
 
         Following CLAUDE.md guidance: Don't block too long with page fully loaded detection mechanism.
         """
         try:
-            # Look for the sign in button with reduced timeouts to avoid blocking too long
-            # Try multiple selectors to find the sign in button
-            sign_in_button = None
-
-            # Method 1: Find button with specific text and native attribute
-            buttons = await self.tab.find(
-                tag_name="button", find_all=True, timeout=5, raise_exc=False
-            )  # Reduced from 10s to 5s
-            if buttons:
-                for button in buttons:
-                    try:
-                        text = await button.text
-                        if text and "Sign in" in text:
-                            # Check if it has native attribute
-                            native_attr = await button.get_attribute("native")
-                            if native_attr == "true":
-                                sign_in_button = button
-                                break
-                    except Exception:
-                        # Skip this button if we can't get its attributes
-                        continue
-
-            # Method 2: Try CSS selector if first method fails
-            if not sign_in_button:
-                sign_in_button = await self.tab.query(
-                    "button[native='true']:has-text('Sign in')",
-                    timeout=5,
-                    raise_exc=False,  # Reduced from 10s to 5s
-                )
-
-            # Method 3: Look for button with data-href attribute containing sign-in
-            if not sign_in_button:
-                buttons = await self.tab.find(
-                    tag_name="button", find_all=True, timeout=5, raise_exc=False
-                )  # Reduced from 10s to 5s
-                if buttons:
-                    for button in buttons:
-                        try:
-                            data_href = await button.get_attribute("data-href")
-                            if data_href and "sign-in" in str(data_href):
-                                sign_in_button = button
-                                break
-                        except Exception:
-                            # Skip this button if we can't get its attributes
-                            continue
+            # Find the sign in button (native "Sign in" button, else a sign-in data-href) in one DOM walk per poll
+            _, sign_in_button = await self._poll_for_match(_SIGN_IN_BUTTON_JS, timeout=5)
 
             if sign_in_button:
                 print("  Found 'Sign in' button, clicking...")
                 await sign_in_button.click()
-                await asyncio.sleep(2)  # Reduced from 3s to 2s to avoid blocking too long
+                self._invalidate_page_cache()
+                await self._wait_for_js(_LOGIN_FORM_READY_JS, timeout=2)
 
                 # Now perform login
                 await self.perform_login_on_page()
@@ -1407,14 +2016,24 @@ class PydollSubstackScraper(BaseSubstackScraper):
 
         return False
 
+    async def _analytics_flags(self) -> dict[str, bool]:
+        """Return the boolean is_* flags of the page's analytics config, parsed once per page source."""
+        page_source = await self._get_page_source_cached()
+        if self._analytics_flags_cache is None or self._analytics_flags_cache[0] is not page_source:
+            flags: dict[str, bool] = {}
+            for match in _ANALYTICS_FLAG_RE.finditer(page_source):
+                flags.setdefault(match.group(1).decode(), match.group(2) == b"true")
+            self._analytics_flags_cache = (page_source, flags)
+        return self._analytics_flags_cache[1]
+
+    async def _analytics_state(self) -> bool | None:
+        """Return the analytics config's is_subscribed flag for the current page, or None if absent."""
+        return (await self._analytics_flags()).get("is_subscribed")
+
     async def check_login_status_via_analytics(self) -> bool:
         """Check if user is logged in by examining the analytics config."""
         try:
-            # Get page source and check for analytics config
-            page_source = await self.tab.page_source
-            if page_source and 'is_subscribed":true' in page_source:
-                return True
-
+            return (await self._analytics_state()) is True
         except Exception as e:
             print(f"  Error checking analytics config: {e}")
 
@@ -1423,35 +2042,30 @@ class PydollSubstackScraper(BaseSubstackScraper):
     async def check_paywall_via_analytics(self) -> bool:
         """Check if content is paywalled by examining the analytics config."""
         try:
-            # Get page source and check for analytics config
-            page_source = await self.tab.page_source
-            if page_source and 'is_subscribed":false' in page_source:
-                return True
-
+            return (await self._analytics_state()) is False
         except Exception as e:
             print(f"  Error checking analytics config for paywall: {e}")
 
         return False
 
+    def _paywall_probes(self) -> list[tuple[str, Callable[[], Awaitable[Any]]]]:
+        """Paywall probes for _first_hit: one union-selector DOM query and the analytics check.
+
+        The DOM query doesn't wait: callers first wait for the paywall to go away, so it is either there or gone.
+        """
+        return [
+            ("paywall_element", lambda: self.tab.query(_PAYWALL_CSS, raise_exc=False)),
+            ("analytics_paywall", self.check_paywall_via_analytics),
+        ]
+
     async def check_paywall_after_login(self) -> bool:
         """Check if paywall is still present after login using multiple methods."""
         try:
-            # Check for paywall using sequential search for reliability
-            paywall_methods = [
-                ("testid_paywall", lambda: self.tab.find(attrs={"data-testid": "paywall"}, timeout=2, raise_exc=False)),
-                ("class_paywall", lambda: self.tab.find(class_name="paywall", timeout=2, raise_exc=False)),
-                ("analytics_paywall", lambda: self.check_paywall_via_analytics()),
-            ]
-
-            for method_name, method_func in paywall_methods:
-                try:
-                    result = await method_func()
-                    if result:
-                        print(f"  ⚠️ Paywall still present after login (detected via: {method_name})")
-                        return True
-                except Exception as e:
-                    print(f"  Failed {method_name}: {e}")
-                    continue
+            # Run the DOM and analytics paywall probes concurrently
+            method_name, _ = await self._first_hit(self._paywall_probes())
+            if method_name:
+                print(f"  ⚠️ Paywall still present after login (detected via: {method_name})")
+                return True
 
             return False
 
@@ -1465,43 +2079,32 @@ class PydollSubstackScraper(BaseSubstackScraper):
         Returns True if paywall was successfully bypassed, False otherwise.
         If paywall cannot be removed by login, warns user and returns False.
         """
-        print(f"🔒 Checking paywall status for: {url}")
+        logger.debug("Checking paywall status for: %s", url)
 
         try:
-            # First, check if user is already logged in by examining analytics config
-            print("  Checking login status via analytics config...")
-            is_logged_in = await self.check_login_status_via_analytics()
+            # First, check the analytics config: one read answers both "logged in?" and "paywalled?"
+            logger.debug("Checking login status via analytics config")
+            try:
+                subscribed = await self._analytics_state()
+            except Exception as e:
+                print(f"  Error checking analytics config: {e}")
+                subscribed = None
 
-            if is_logged_in:
-                print("  ✅ User is already logged in")
+            if subscribed is True:
+                logger.debug("User is already logged in")
                 return True
 
-            # Check for paywall using sequential detection for reliability
-            print("  Detecting paywall...")
-
-            # Try different paywall detection methods sequentially
-            paywall_methods = [
-                ("testid_paywall", lambda: self.tab.find(attrs={"data-testid": "paywall"}, timeout=2, raise_exc=False)),
-                ("title_paywall", lambda: self.tab.find(tag_name="h2", class_name="paywall-title", timeout=2, raise_exc=False)),
-                ("class_paywall", lambda: self.tab.find(class_name="paywall", timeout=2, raise_exc=False)),
-                ("analytics_paywall", lambda: self.check_paywall_via_analytics()),
-            ]
-
-            paywall_detected = False
-            for method_name, method_func in paywall_methods:
-                try:
-                    result = await method_func()
-                    if result:
-                        paywall_detected = True
-                        print(f"  ✓ Paywall detected via: {method_name}")
-                        break
-                except Exception as e:
-                    print(f"  Failed {method_name}: {e}")
-                    continue
-
-            if not paywall_detected:
-                print("  ✅ No paywall detected - content is accessible")
-                return True
+            if subscribed is False:
+                logger.debug("Paywall detected via: analytics_paywall")
+            else:
+                # No analytics config on the page, fall back to looking for the paywall element
+                logger.debug("Detecting paywall")
+                # The page load wait already ended on the paywall if there is one, so don't wait for it again
+                if await self.tab.query(_PAYWALL_CSS, raise_exc=False):
+                    logger.debug("Paywall detected via: paywall_element")
+                else:
+                    logger.debug("No paywall detected - content is accessible")
+                    return True
 
             # If we have credentials, try to log in
             if SUBSTACK_EMAIL and SUBSTACK_PASSWORD:
@@ -1512,9 +2115,14 @@ class PydollSubstackScraper(BaseSubstackScraper):
                 sign_in_clicked = await self.handle_sign_in_button()
 
                 login_success = False
+                if sign_in_clicked and self._session_restored:
+                    # The page offered a sign-in button, so the restored session is no longer valid
+                    print("  Saved login session has expired, discarding it")
+                    self.forget_session_cookies()
                 if sign_in_clicked:
                     print("  ✅ Clicked 'Sign in' button, checking if login was successful...")
-                    await asyncio.sleep(3)  # Wait for login to complete
+                    await self._wait_for_js(_SUBSCRIBED_JS, timeout=3)  # Wait for login to complete
+                    self._invalidate_page_cache()
 
                     # Check if we're now logged in
                     login_success = await self.check_login_status_via_analytics()
@@ -1533,18 +2141,22 @@ class PydollSubstackScraper(BaseSubstackScraper):
 
                 if login_success:
                     print("  ✅ Login successful, checking if paywall is bypassed...")
-                    await asyncio.sleep(3)  # Wait for page to update after login
+                    await self._wait_for_js(_PAYWALL_GONE_JS, timeout=3)  # Wait for page to update after login
+                    self._invalidate_page_cache()
 
                     # Check if paywall is still present after login using multiple methods
                     paywall_still_present = await self.check_paywall_after_login()
 
                     if not paywall_still_present:
                         print("  ✅ Paywall successfully bypassed!")
+                        if sign_in_clicked:
+                            await self.save_session_cookies()
                         return True
                     else:
                         print("  ❌ Paywall still present after login - article requires paid subscription")
                         print(f"  ⚠️  WARNING: Cannot access paywalled content: {url}")
                         print("  ⚠️  This article will be skipped and not saved.")
+                        await self.remember_paywalled(url)
                         return False
                 else:
                     print("  ❌ Login failed")
@@ -1555,6 +2167,7 @@ class PydollSubstackScraper(BaseSubstackScraper):
                 print("  ❌ No credentials provided for login")
                 print(f"  ⚠️  WARNING: Cannot access paywalled content (no credentials): {url}")
                 print("  ⚠️  This article will be skipped and not saved.")
+                # Not remembered: a later run with credentials may well get past the paywall
                 return False
 
         except Exception as e:
@@ -1576,30 +2189,45 @@ class PydollSubstackScraper(BaseSubstackScraper):
             return False
 
     async def ensure_browser_initialized(self) -> None:
-        """Ensure browser is initialized and healthy, reconnect if needed."""
-        if not await self.check_browser_health():
-            print("  Browser connection lost, reinitializing...")
-            # Clean up old browser if exists
-            if self.browser:
-                try:
-                    await self.browser.stop()
-                except Exception:
-                    pass
-
-            # Reinitialize
-            await self.initialize_browser()
-
-            # Re-login if we were logged in before
-            if self.is_logged_in and (USE_PREMIUM or (SUBSTACK_EMAIL and SUBSTACK_PASSWORD) or self.manual_login):
-                print("  Re-establishing login session...")
-                if self.manual_login:
-                    print("  Manual login was used previously. You may need to login again if prompted.")
-                    self.is_logged_in = True  # Assume still logged in for manual mode
-                else:
-                    await self.login()
+        """Ensure a browser is started.
+
+        Liveness is not probed here (that would cost a CDP round-trip per article); a dead connection
+        surfaces as a connection error from the next real call and get_url_soup reconnects then.
+        """
+        if self.browser is None or self.tab is None:
+            print("  Browser not running, initializing...")
+            await self.reinitialize_browser()
+
+    async def reinitialize_browser(self) -> None:
+        """Restart the browser, re-establishing the login session if we were logged in."""
+        # Clean up old browser if exists
+        if self.browser:
+            try:
+                await self.browser.stop()
+            except Exception:
+                pass
+
+        # Reinitialize
+        await self.initialize_browser()
+
+        # Re-login if we were logged in before
+        if self.is_logged_in and (USE_PREMIUM or (SUBSTACK_EMAIL and SUBSTACK_PASSWORD) or self.manual_login):
+            print("  Re-establishing login session...")
+            if await self.restore_session_cookies():
+                print("  ✓ Restored saved login session")
+            elif self.manual_login:
+                print("  Manual login was used previously. You may need to login again if prompted.")
+                self.is_logged_in = True  # Assume still logged in for manual mode
+            else:
+                await self.login()
 
     async def get_url_soup(self, url: str) -> BeautifulSoup | None:
         """Get BeautifulSoup from URL using Pydoll."""
+        # Posts found paywalled on a recent run are skipped without loading them again
+        if self.is_known_paywalled(url):
+            print(f"  ❌ Skipping known paywalled article: {url}")
+            return None
+
         # Ensure browser is healthy before proceeding
         await self.ensure_browser_initialized()
 
@@ -1607,13 +2235,19 @@ class PydollSubstackScraper(BaseSubstackScraper):
             raise RuntimeError("Browser not initialized. Call initialize_browser() first.")
 
         try:
-            # Enable Cloudflare bypass if needed
-            async with self.tab.expect_and_bypass_cloudflare_captcha():
-                await self.tab.go_to(url)
-
-            # Wait for initial page load - reduced timeout to avoid blocking too long
-            print("  Waiting for page to load (reduced timeout to avoid blocking)...")
-            await asyncio.sleep(3)  # Reduced from 5s to 3s as per CLAUDE.md guidance
+            # Cloudflare captchas are handled by the auto-solve enabled in initialize_browser
+            await self._go_to(url)
+
+            # Wait for initial page load - returns as soon as the article shell is there, at most 3s
+            logger.debug("Waiting for page to load")
+            await self._wait_for_js(_ARTICLE_OR_PAYWALL_READY_JS, timeout=3)
+
+            # Without a login and without credentials to log in with, a paywall can't be bypassed: skip the post
+            # now instead of waiting for its content to load
+            if not self.is_logged_in and not (SUBSTACK_EMAIL and SUBSTACK_PASSWORD):
+                if await self.tab.query(_PAYWALL_CSS, raise_exc=False):
+                    print(f"  Skipping premium article (login required): {url}")
+                    return None
 
             # Check for sign in button on the page (for non-logged in users)
             if not self.is_logged_in and (SUBSTACK_EMAIL and SUBSTACK_PASSWORD):
@@ -1622,12 +2256,12 @@ class PydollSubstackScraper(BaseSubstackScraper):
 
                 # If we just logged in, we might need to navigate back to the article
                 if sign_in_handled:
-                    await asyncio.sleep(2)  # Reduced from 3s to avoid blocking too long
+                    await self._wait_for_js("document.readyState === 'complete'", timeout=2)
                     # Check current URL - if we're not on the article page, go back
-                    current_url = await self.tab.current_url
+                    current_url = await self._current_page_url()
                     if url not in current_url:
-                        await self.tab.go_to(url)
-                        await asyncio.sleep(3)  # Reduced from 5s to 3s
+                        await self._go_to(url)
+                        await self._wait_for_js(_ARTICLE_READY_JS, timeout=3)
 
             # Check for paywall and attempt to bypass it
             paywall_bypassed = await self.handle_paywall(url)
@@ -1636,105 +2270,48 @@ class PydollSubstackScraper(BaseSubstackScraper):
                 print(f"  ❌ Skipping paywalled article: {url}")
                 return None
 
-            # Wait for content to load with reduced timeouts to avoid blocking too long
-            content_loaded = False
-            print("  Looking for content elements (with reduced timeouts)...")
-
-            # Try to find the body markup which contains the actual content
-            body_markup = await self.tab.query(
-                "div.body.markup", timeout=15, raise_exc=False
-            )  # Reduced from 30s to 15s
-            if body_markup:
-                content_loaded = True
-                print("  ✓ Found div.body.markup")
-                await asyncio.sleep(1)  # Reduced wait time to avoid blocking too long
+            # Wait for content to load: all content selectors are checked in one script evaluation per poll
+            logger.debug("Looking for content elements")
+            selector_name = await self._wait_for_content(timeout=5)
+            if selector_name:
+                logger.debug("Found %s", selector_name)
+                # Returns once the body stops growing between two samples instead of always sleeping
+                await self._wait_for_stable_content(timeout=2)
             else:
-                # Try other selectors sequentially for reliability
-                print("  Trying multiple content selectors...")
-
-                # Try different content selectors sequentially
-                selectors = ["available-content", "article", "post-content"]
-                for selector in selectors:
-                    try:
-                        content_elem = await self.tab.find(class_name=selector, timeout=3, raise_exc=False)
-                        if content_elem:
-                            content_loaded = True
-                            print(f"  ✓ Found {selector}")
-                            break
-                    except Exception as e:
-                        print(f"  Failed {selector}: {e}")
-                        continue
-
-            # Additional wait for dynamic content if needed - with sequential fallback search
-            if not content_loaded:
-                print("  Trying fallback content selectors...")
-
-                # Try fallback selectors sequentially
-                fallback_selectors = [
-                    ("article", lambda: self.tab.find(tag_name="article", timeout=3, raise_exc=False)),
-                    ("main", lambda: self.tab.find(tag_name="main", timeout=3, raise_exc=False)),
-                    ("content", lambda: self.tab.find(class_name="content", timeout=3, raise_exc=False)),
-                    ("post", lambda: self.tab.find(class_name="post", timeout=3, raise_exc=False)),
-                ]
-
-                for selector_name, selector_func in fallback_selectors:
-                    try:
-                        element = await selector_func()
-                        if element:
-                            content_loaded = True
-                            print(f"  ✓ Found {selector_name} (fallback)")
-                            await asyncio.sleep(1)  # Brief wait for content to stabilize
-                            break
-                    except Exception as e:
-                        print(f"  Failed {selector_name}: {e}")
-                        continue
-
-                if not content_loaded:
-                    print("  ⚠️ Warning: Could not find expected content selectors")
-                    await asyncio.sleep(2)  # Reduced wait time
-
-            # Final check for paywall (after potential login) using sequential search
-            print("  Checking for paywall...")
+                print("  ⚠️ Warning: Could not find expected content selectors")
 
-            # Try paywall detection methods sequentially
-            final_paywall = None
-            paywall_final_methods = [
-                ("class_paywall", lambda: self.tab.find(class_name="paywall", timeout=2, raise_exc=False)),
-                ("testid_paywall", lambda: self.tab.find(attrs={"data-testid": "paywall"}, timeout=2, raise_exc=False)),
-            ]
-
-            for method_name, method_func in paywall_final_methods:
-                try:
-                    result = await method_func()
-                    if result:
-                        final_paywall = result
-                        print(f"  ✓ Paywall detected via {method_name}")
-                        break
-                except Exception as e:
-                    print(f"  Failed {method_name}: {e}")
-                    continue
+            # Final check for paywall (after potential login) with one union-selector query; the content is loaded by
+            # now, so the paywall is either already on the page or not coming
+            logger.debug("Checking for paywall")
+            final_paywall = await self.tab.query(_PAYWALL_CSS, raise_exc=False)
+            if final_paywall:
+                logger.debug("Paywall element detected")
 
             if final_paywall and not self.is_logged_in:
                 print(f"  Skipping premium article (login required): {url}")
                 return None
 
-            # Get page source
-            page_source = await self.tab.page_source
-            return BeautifulSoup(page_source, "html.parser")
+            # Reuse the source the analytics checks already fetched when it holds the post body; only serialize
+            # the DOM again when the content loaded after that snapshot
+            page_source = self._page_source_cache.get(await self._current_page_url())
+            if not page_source or _POST_BODY_MARKER not in page_source:
+                page_source = await self._get_page_source_cached(refresh=True)
+            self._release_page_source()
+            return await asyncio.to_thread(_parse_post_html, page_source)
 
         except Exception as e:
-            error_msg = str(e)
-            if "Connect call failed" in error_msg and "9263" in error_msg:
+            if isinstance(e, (OSError, asyncio.TimeoutError)) or "Connect call failed" in str(e):
                 # Browser connection lost
                 print(f"  Browser connection lost while fetching {url}")
                 print("  Attempting to reconnect...")
-                await self.ensure_browser_initialized()
+                await self.reinitialize_browser()
                 # Try once more
                 try:
-                    await self.tab.go_to(url)
-                    await asyncio.sleep(3)
-                    page_source = await self.tab.page_source
-                    return BeautifulSoup(page_source, "html.parser")
+                    await self._go_to(url)
+                    await self._wait_for_js(_ARTICLE_READY_JS, timeout=3)
+                    page_source = await self._get_page_source_cached()
+                    self._release_page_source()
+                    return await asyncio.to_thread(_parse_post_html, page_source)
                 except Exception as retry_e:
                     print(f"  Retry failed: {retry_e}")
                     return None
@@ -1742,30 +2319,103 @@ class PydollSubstackScraper(BaseSubstackScraper):
                 print(f"Error fetching page {url}: {e}")
                 return None
 
+    async def start_session(self) -> None:
+        """Start the browser and log in if premium scraping is enabled."""
+        await self.initialize_browser()
+
+        # Login if premium scraping is enabled
+        if USE_PREMIUM or (SUBSTACK_EMAIL and SUBSTACK_PASSWORD) or self.manual_login:
+            if await self.restore_session_cookies():
+                print("✓ Restored saved login session, skipping login")
+                self.is_logged_in = True
+            elif self.manual_login:
+                await self.perform_manual_login()
+            else:
+                await self.login()
+
     async def scrape_posts(
         self, num_posts_to_scrape: int = 0, continuous: bool = False, skip_browser_init: bool = False
     ) -> None:
         """Override to handle browser lifecycle."""
         try:
             if not skip_browser_init:
-                await self.initialize_browser()
-
-                # Login if premium scraping is enabled
-                if USE_PREMIUM or (SUBSTACK_EMAIL and SUBSTACK_PASSWORD) or self.manual_login:
-                    if self.manual_login:
-                        await self.perform_manual_login()
-                    else:
-                        await self.login()
+                await self.start_session()
 
             # Call parent scrape_posts with continuous parameter
             await super().scrape_posts(num_posts_to_scrape, continuous)
 
         finally:
+            await self.close_http_session()
+
             # Don't stop the browser if it's shared
             if self.browser and not skip_browser_init:
                 await self.browser.stop()
 
+    async def scrape_posts_concurrently(
+        self,
+        num_posts_to_scrape: int = 0,
+        max_concurrent: int = 3,
+        continuous: bool = False,
+        skip_browser_init: bool = False,
+    ) -> None:
+        """Like scrape_posts, but load up to max_concurrent posts at once, each in its own tab of the browser."""
+        try:
+            if not skip_browser_init:
+                await self.start_session()
 
+            self._tab_pool = await self._open_tab_pool(max_concurrent)
+            await super().scrape_posts(num_posts_to_scrape, continuous, max_concurrent=max_concurrent)
+
+        finally:
+            await self._close_tab_pool()
+            await self.close_http_session()
+
+            # Don't stop the browser if it's shared
+            if self.browser and not skip_browser_init:
+                await self.browser.stop()
+
+    async def _open_tab_pool(self, size: int) -> asyncio.Queue["PydollSubstackScraper"]:
+        """One scraper view per tab: this scraper's tab plus size - 1 new ones in the same (logged-in) browser.
+
+        The views share everything but the tab and its page caches, including the image session and semaphore.
+        """
+        # Created before copying so every view uses (and updates) the same ones; lazily created containers would
+        # otherwise be built separately per view, and an image or post one tab saved would be unknown to the rest
+        await self._get_http_session()
+        self._image_files()
+        self._get_existing_urls_from_files()
+        pool: asyncio.Queue[PydollSubstackScraper] = asyncio.Queue()
+        for i in range(max(size, 1)):
+            view = copy.copy(self)
+            if i:
+                view.tab = await self.browser.new_tab()
+                await self._prepare_tab(view.tab)
+            view._tab_pool = None
+            view._page_source_cache = {}
+            view._current_url = None
+            view._analytics_flags_cache = None
+            pool.put_nowait(view)
+        return pool
+
+    async def _close_tab_pool(self) -> None:
+        """Close the extra tabs opened by _open_tab_pool."""
+        pool, self._tab_pool = self._tab_pool, None
+        while pool is not None and not pool.empty():
+            view = pool.get_nowait()
+            if view.tab is not self.tab:
+                with contextlib.suppress(Exception):
+                    await view.tab.close()
+
+    async def scrape_single_post_with_date(self, url: str) -> dict[str, Any] | None:
+        """Scrape a post, on a free tab of the pool when scrape_posts_concurrently is running."""
+        if self._tab_pool is None:
+            return await super().scrape_single_post_with_date(url)
+
+        view = await self._tab_pool.get()
+        try:
+            return await view.scrape_single_post(url)
+        finally:
+            self._tab_pool.put_nowait(view)
 
     async def scrape_single_post(self, url: str) -> dict[str, Any] | None:
         """Scrape a single post and return its data using date-based filenames."""
@@ -1795,7 +2445,8 @@ Examples:
   # Run in headless mode (default is non-headless for user intervention)
   pydoll-substack2md https://example.substack.com --headless
 
-
+  # Load up to 5 posts at a time, each in its own browser tab
+  pydoll-substack2md https://example.substack.com --concurrent --max-concurrent 5
 
   # Custom delay between requests (1-5 seconds)
   pydoll-substack2md https://example.substack.com --delay-min 1 --delay-max 5
@@ -1809,6 +2460,9 @@ Examples:
   # Scrape from a file containing URLs
   pydoll-substack2md --urls-file substacks.txt
 
+  # Scrape up to 3 Substacks at a time, each in its own browser
+  pydoll-substack2md --urls-file substacks.txt --concurrency 3
+
   # Continuous mode with interval (re-run every 30 minutes)
   pydoll-substack2md --urls-file substacks.txt --continuous --interval 30
 
@@ -1901,6 +2555,42 @@ Examples:
         type=str,
         help="File containing Substack URLs (one per line)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of Substacks to scrape at the same time, each with its own browser (default: 1)",
+    )
+    parser.add_argument(
+        "--concurrent",
+        action="store_true",
+        help="Load several posts of a Substack at the same time, each in its own browser tab",
+    )
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=3,
+        help="Number of browser tabs used with --concurrent (default: 3)",
+    )
+    parser.add_argument(
+        "--load-page-resources",
+        action="store_true",
+        help="Let the browser load images, fonts, media and trackers on post pages (blocked by default for "
+        "faster page loads; post images are downloaded either way)",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        type=str,
+        default=BROWSER_PROFILE_DIR,
+        help="Chrome profile directory kept between runs, pass '' for a fresh temporary profile "
+        "(default: ~/.cache/pydoll-substack2md/profile)",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Print per-page progress details (page load, content and paywall checks, image processing)",
+    )
 
     return parser.parse_args()
 
@@ -1910,13 +2600,11 @@ async def scrape_single_url(
     args,
     use_login: bool,
     use_manual_login: bool,
-    shared_browser=None,
-    shared_tab=None,
-    shared_login_status=False,
-) -> tuple:
-    """Scrape a single Substack URL, optionally using a shared browser session.
+    scraper: PydollSubstackScraper | None = None,
+) -> PydollSubstackScraper:
+    """Scrape a single Substack URL, optionally reusing the scraper (and browser session) of a previous URL.
 
-    Returns: (browser, tab, is_logged_in) tuple for reuse
+    Returns: the scraper, for reuse with the next URL
     """
     print(f"\n{'=' * 60}")
     print(f"Scraping: {url}")
@@ -1926,100 +2614,123 @@ async def scrape_single_url(
     print(f"Delay range: {args.delay_min}-{args.delay_max} seconds")
     print(f"{'=' * 60}\n")
 
-    scraper = PydollSubstackScraper(
-        base_substack_url=url,
-        md_save_dir=args.directory,
-        html_save_dir=args.html_directory,
-        headless=args.headless or HEADLESS,
-        browser_path=args.browser_path or BROWSER_PATH,
-        user_agent=args.user_agent or USER_AGENT,
-        delay_range=(args.delay_min, args.delay_max),
-        manual_login=use_manual_login,
-    )
+    # Setting up a scraper fetches the sitemap with blocking requests and reads the output directories, so it runs
+    # in a thread to keep the other Substacks' scrapes (--concurrency) going meanwhile
+    reuse_browser = False
+    if scraper is None:
+        scraper = await asyncio.to_thread(
+            PydollSubstackScraper,
+            base_substack_url=url,
+            md_save_dir=args.directory,
+            html_save_dir=args.html_directory,
+            headless=args.headless or HEADLESS,
+            browser_path=args.browser_path or BROWSER_PATH,
+            user_agent=args.user_agent or USER_AGENT,
+            delay_range=(args.delay_min, args.delay_max),
+            manual_login=use_manual_login,
+            block_resources=not args.load_page_resources,
+            # Chrome locks a profile to one browser process, so browsers running side by side get one each
+            profile_dir=os.path.join(args.profile_dir, extract_main_part(url))
+            if args.profile_dir and args.concurrency > 1
+            else args.profile_dir,
+        )
+    else:
+        await asyncio.to_thread(scraper.retarget, url)
+
+        # Reuse the previous browser session if it is still alive
+        if scraper.browser and scraper.tab:
+            print("🔄 Reusing existing browser session")
+            reuse_browser = await scraper.check_browser_health()
+            if not reuse_browser:
+                print("⚠️  Shared browser session is dead, creating new session...")
+                scraper.browser = None
+                scraper.tab = None
+                scraper.is_logged_in = False
+
+    if args.concurrent:
+        await scraper.scrape_posts_concurrently(
+            num_posts_to_scrape=args.number or NUM_POSTS_TO_SCRAPE,
+            max_concurrent=args.max_concurrent,
+            continuous=args.continuous,
+            skip_browser_init=reuse_browser,
+        )
+    else:
+        await scraper.scrape_posts(
+            num_posts_to_scrape=args.number or NUM_POSTS_TO_SCRAPE,
+            continuous=args.continuous,
+            skip_browser_init=reuse_browser,
+        )
 
-    # Use shared browser if provided
-    if shared_browser and shared_tab:
-        print("🔄 Reusing existing browser session")
-        scraper.browser = shared_browser
-        scraper.tab = shared_tab
-        scraper.is_logged_in = shared_login_status
-
-        # Check browser health
-        if not await scraper.check_browser_health():
-            print("⚠️  Shared browser session is dead, creating new session...")
-            shared_browser = None
-            shared_tab = None
-            scraper.browser = None
-            scraper.tab = None
-            scraper.is_logged_in = False
-
-    await scraper.scrape_posts(
-        num_posts_to_scrape=args.number or NUM_POSTS_TO_SCRAPE,
-        continuous=args.continuous,
-        skip_browser_init=bool(shared_browser),
-    )
+    return scraper
+
+
+async def scrape_urls_concurrently(urls: list[str], args, use_login: bool, use_manual_login: bool) -> None:
+    """Scrape several Substack URLs at once, at most args.concurrency at a time.
+
+    Each URL gets its own browser session (no sharing), which is closed when it finishes.
+    In non-continuous mode the first error is re-raised once all URLs have finished.
+    """
+    semaphore = asyncio.Semaphore(args.concurrency)
 
-    # Return browser, tab, and login status for reuse
-    return scraper.browser, scraper.tab, scraper.is_logged_in
+    async def scrape_bounded(url: str) -> None:
+        async with semaphore:
+            print(f"\n📍 Processing: {url}")
+            await scrape_single_url(url, args, use_login, use_manual_login)
+            print(f"✅ Completed: {url}")
 
+    results = await asyncio.gather(*[scrape_bounded(url) for url in urls], return_exceptions=True)
+    errors = [(url, result) for url, result in zip(urls, results) if isinstance(result, BaseException)]
+    for url, error in errors:
+        print(f"❌ Error scraping {url}: {error}")
+    if errors and not args.continuous:
+        raise errors[0][1]
 
-def get_urls_from_file(filepath: str) -> list[str]:
-    """Read URLs from a file (one per line)."""
-    urls = []
+
+def get_urls_from_file(filepath: str) -> Iterator[str]:
+    """Yield URLs from a file (one per line)."""
     try:
         with open(filepath) as f:
             for line in f:
                 line = line.strip()
                 if line and not line.startswith("#"):
-                    urls.append(line)
+                    yield line
     except FileNotFoundError:
         print(f"Error: URLs file '{filepath}' not found")
         sys.exit(1)
-    return urls
 
 
-def get_urls_from_stdin() -> list[str]:
-    """Read URLs from stdin if available."""
-    urls = []
+def get_urls_from_stdin() -> Iterator[str]:
+    """Yield URLs from stdin if available."""
     if not sys.stdin.isatty():
         for line in sys.stdin:
             line = line.strip()
             if line and not line.startswith("#"):
-                urls.append(line)
-    return urls
+                yield line
 
 
 async def main():
     """Main entry point."""
     args = parse_args()
 
-    # Collect URLs from various sources
-    urls = []
-
-    # From command line arguments
-    if args.urls:
-        urls.extend(args.urls)
-
-    # From file
-    if args.urls_file:
-        urls.extend(get_urls_from_file(args.urls_file))
-
-    # From stdin
-    stdin_urls = get_urls_from_stdin()
-    if stdin_urls:
-        urls.extend(stdin_urls)
+    # Per-page progress goes to logger.debug, which costs next to nothing when it is not shown
+    if args.verbose:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("  %(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+
+    # Collect URLs from the command line, the URLs file and stdin, streaming them through an
+    # order-preserving dedupe
+    urls = itertools.chain(
+        args.urls or (),
+        get_urls_from_file(args.urls_file) if args.urls_file else (),
+        get_urls_from_stdin(),
+    )
+    unique_urls = list(dict.fromkeys(urls))
 
     # From environment variable as fallback
-    if not urls and BASE_SUBSTACK_URL:
-        urls.append(BASE_SUBSTACK_URL)
-
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_urls = []
-    for url in urls:
-        if url not in seen:
-            seen.add(url)
-            unique_urls.append(url)
+    if not unique_urls and BASE_SUBSTACK_URL:
+        unique_urls.append(BASE_SUBSTACK_URL)
 
     if not unique_urls:
         print("Error: No Substack URLs provided. Use -h for help.")
@@ -2045,43 +2756,52 @@ async def main():
         print("Error: --delay-min cannot be greater than --delay-max")
         sys.exit(1)
 
+    # Validate concurrency
+    if args.concurrency < 1:
+        print("Error: --concurrency must be at least 1")
+        sys.exit(1)
+    if use_manual_login and args.concurrency > 1:
+        print("Error: Manual login mode cannot be used with --concurrency greater than 1")
+        sys.exit(1)
+    if args.max_concurrent < 1:
+        print("Error: --max-concurrent must be at least 1")
+        sys.exit(1)
+
     print(f"\n🎯 Starting scraper for {len(unique_urls)} Substack(s)")
     if args.continuous and args.interval > 0:
         print(f"📅 Continuous mode: Will re-run every {args.interval} minutes")
 
-    # Main scraping loop
-    shared_browser = None
-    shared_tab = None
-    shared_login_status = False
+    # Main scraping loop; in sequential mode one scraper (and its browser session) is reused across URLs
+    scraper = None
 
     try:
         while True:
-            start_time = time.time()
+            # Monotonic deadline for the next run, unaffected by wall-clock changes (NTP, DST)
+            next_run_deadline = time.monotonic() + args.interval * 60
 
-            # Scrape all URLs
-            for i, url in enumerate(unique_urls, 1):
-                print(f"\n📍 Processing {i}/{len(unique_urls)}: {url}")
-                try:
-                    # Reuse browser session across URLs
-                    shared_browser, shared_tab, shared_login_status = await scrape_single_url(
-                        url, args, use_login, use_manual_login, shared_browser, shared_tab, shared_login_status
-                    )
-                    print(f"✅ Completed: {url}")
-                except Exception as e:
-                    print(f"❌ Error scraping {url}: {e}")
-                    if args.continuous:
-                        print("   Continuing with next URL...")
-                        continue
-                    else:
-                        raise
+            # Scrape all URLs, concurrently with separate browsers if requested
+            if args.concurrency > 1:
+                await scrape_urls_concurrently(unique_urls, args, use_login, use_manual_login)
+            else:
+                for i, url in enumerate(unique_urls, 1):
+                    print(f"\n📍 Processing {i}/{len(unique_urls)}: {url}")
+                    try:
+                        scraper = await scrape_single_url(url, args, use_login, use_manual_login, scraper)
+                        print(f"✅ Completed: {url}")
+                    except Exception as e:
+                        print(f"❌ Error scraping {url}: {e}")
+                        if args.continuous:
+                            print("   Continuing with next URL...")
+                            continue
+                        else:
+                            raise
 
             # Check if we should continue
             if not args.continuous or args.interval <= 0:
                 break
 
             # Calculate time until next run
-            elapsed = time.time() - start_time
-            wait_time = max(0, args.interval * 60 - elapsed)
+            wait_time = max(0, next_run_deadline - time.monotonic())
 
             if wait_time > 0:
                 print(f"\n⏰ Waiting {wait_time / 60:.1f} minutes until next run...")
@@ -2096,9 +2816,9 @@ async def main():
 
     finally:
         # Clean up the shared browser session when done
-        if shared_browser:
+        if scraper and scraper.browser:
             print("\n🔧 Closing browser session...")
-            await shared_browser.stop()
+            await scraper.browser.stop()
 
 
 def run():
@@ -1,16 +1,38 @@
+import asyncio
+import hashlib
+import itertools
+import json
 import os
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
 
 # type: ignore (test file with pytest - complex typing)
 from unittest.mock import AsyncMock, patch
+from urllib.parse import urljoin
 
+import markdown
 import pytest  # type: ignore
-from bs4 import BeautifulSoup
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from bs4 import BeautifulSoup, Tag
 
 from pydoll_substack2md.pydoll_scraper import (
     BaseSubstackScraper,
     PydollSubstackScraper,
+    _dump_json_bytes,
+    _iter_xml_elements,
+    _parse_post_html,
     extract_main_part,
+    generate_html_file,
+    get_urls_from_file,
+    parse_date_fast,
+    scrape_single_url,
+    scrape_urls_concurrently,
 )
 
 
@@ -30,6 +52,119 @@ class TestExtractMainPart:
         assert extract_main_part(url) == "complex"
 
 
+class TestScrapeUrlsConcurrently:
+    """Test bounded multi-URL scraping."""
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_respects_concurrency_limit(self):
+        args = SimpleNamespace(concurrency=2, continuous=False)
+        active = 0
+        peak = 0
+        scraped = []
+
+        async def fake_scrape(url, *rest):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            scraped.append(url)
+            active -= 1
+
+        urls = [f"https://s{i}.substack.com" for i in range(5)]
+        with patch("pydoll_substack2md.pydoll_scraper.scrape_single_url", fake_scrape):
+            await scrape_urls_concurrently(urls, args, False, False)
+
+        assert sorted(scraped) == urls
+        assert peak == 2
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_error_raised_after_all_finish_unless_continuous(self):
+        scraped = []
+
+        async def fake_scrape(url, *rest):
+            if "bad" in url:
+                raise RuntimeError("boom")
+            scraped.append(url)
+
+        urls = ["https://bad.substack.com", "https://good.substack.com"]
+        with patch("pydoll_substack2md.pydoll_scraper.scrape_single_url", fake_scrape):
+            with pytest.raises(RuntimeError):
+                await scrape_urls_concurrently(urls, SimpleNamespace(concurrency=2, continuous=False), False, False)
+            assert scraped == ["https://good.substack.com"]
+
+            await scrape_urls_concurrently(urls, SimpleNamespace(concurrency=2, continuous=True), False, False)
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_scraper_setup_runs_off_the_event_loop(self, tmp_path):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        def slow_sitemap(self):
+            time.sleep(0.2)  # A blocking request
+            return []
+
+        args = SimpleNamespace(
+            directory=str(tmp_path / "md"),
+            html_directory=str(tmp_path / "html"),
+            headless=True,
+            browser_path="",
+            user_agent="",
+            delay_min=0,
+            delay_max=0,
+            load_page_resources=False,
+            profile_dir="",
+            concurrency=2,
+            concurrent=False,
+            number=0,
+            continuous=False,
+        )
+        with (
+            patch.object(PydollSubstackScraper, "get_all_post_urls", slow_sitemap),
+            patch.object(PydollSubstackScraper, "scrape_posts", AsyncMock()) as scrape_posts,
+        ):
+            ticking = asyncio.create_task(ticker())
+            await scrape_single_url("https://test.substack.com", args, False, False)
+            ticking.cancel()
+
+        scrape_posts.assert_awaited_once()
+        assert ticks >= 5
+
+
+def test_get_urls_from_file_streams_urls(tmp_path):
+    urls_file = tmp_path / "substacks.txt"
+    urls_file.write_text("# comment\nhttps://a.substack.com\n\n  https://b.substack.com  \n", encoding="utf-8")
+
+    urls = get_urls_from_file(str(urls_file))
+
+    assert iter(urls) is urls
+    assert list(urls) == ["https://a.substack.com", "https://b.substack.com"]
+
+
+class TestParseDateFast:
+    """Test the parse_date_fast function."""
+
+    def test_parse_iso_date(self):
+        assert parse_date_fast("2024-01-15T12:30:00.000Z") == datetime(2024, 1, 15)
+
+    def test_parse_month_day_year(self):
+        assert parse_date_fast("Jan 5, 2024") == datetime(2024, 1, 5)
+        assert parse_date_fast("March 12 2023") == datetime(2023, 3, 12)
+
+    def test_unknown_format_returns_none(self):
+        assert parse_date_fast("5 days ago") is None
+        assert parse_date_fast("2024-02-31") is None
+
+    def test_dateparser_not_imported_with_module(self):
+        code = "import sys, pydoll_substack2md.pydoll_scraper; print('dateparser' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
+
+
 class TestBaseSubstackScraper:
     """Test the BaseSubstackScraper abstract base class."""
 
@@ -64,6 +199,11 @@ class TestBaseSubstackScraper:
         assert len(filtered) == 2
         assert "https://test.substack.com/p/post1" in filtered
         assert "https://test.substack.com/p/post2" in filtered
+        assert BaseSubstackScraper.filter_urls(urls, []) == urls
+        # Keywords are matched literally, not as regex syntax
+        assert BaseSubstackScraper.filter_urls(["https://a.test/p/axb", "https://a.test/p/a.b"], ["a.b"]) == [
+            "https://a.test/p/axb"
+        ]
 
     def test_html_to_md(self):
         html = "<h1>Title</h1><p>This is a <strong>test</strong> paragraph.</p>"
@@ -89,12 +229,502 @@ class TestBaseSubstackScraper:
         assert "**Likes:** 42" in result
         assert "Test content" in result
 
+    def test_get_existing_urls_from_files_is_cached(self, scraper):
+        Path(scraper.md_save_dir, "20240101-first-post.md").write_text("x", encoding="utf-8")
+        Path(scraper.md_save_dir, "old-post.md").write_text("x", encoding="utf-8")
+        Path(scraper.md_save_dir, ".scraping_state.json").write_text("{}", encoding="utf-8")
+
+        assert scraper._get_existing_urls_from_files() == {"first-post", "old-post"}
+
+        # Later files are only picked up when the scraper records them itself
+        Path(scraper.md_save_dir, "20240102-second-post.md").write_text("x", encoding="utf-8")
+        assert scraper._get_existing_urls_from_files() == {"first-post", "old-post"}
+
+    def test_fetch_urls_from_sitemap_and_feed(self, scraper):
+        sitemap = (
+            b'<?xml version="1.0" encoding="UTF-8"?>'
+            b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            b"<url><loc>https://test.substack.com/p/one</loc></url>"
+            b"<url><loc>https://test.substack.com/p/two</loc></url>"
+            b"</urlset>"
+        )
+        feed = (
+            b'<?xml version="1.0"?><rss><channel><link>https://test.substack.com</link>'
+            b"<item><title>One</title><link>https://test.substack.com/p/one</link></item>"
+            b"<item><title>No link</title></item>"
+            b"</channel></rss>"
+        )
+
+        with patch("pydoll_substack2md.pydoll_scraper.requests.get") as get:
+            get.return_value = SimpleNamespace(ok=True, status_code=200, content=sitemap, headers={})
+            assert scraper.fetch_urls_from_sitemap() == [
+                "https://test.substack.com/p/one",
+                "https://test.substack.com/p/two",
+            ]
+            get.return_value = SimpleNamespace(ok=True, status_code=200, content=feed, headers={})
+            assert scraper.fetch_urls_from_feed() == ["https://test.substack.com/p/one"]
+
+    def test_fetch_urls_from_sitemap_reuses_unchanged_sitemap(self, scraper):
+        sitemap = (
+            b'<?xml version="1.0" encoding="UTF-8"?>'
+            b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            b"<url><loc>https://test.substack.com/p/one</loc></url>"
+            b"</urlset>"
+        )
+        expected = ["https://test.substack.com/p/one"]
+
+        with patch("pydoll_substack2md.pydoll_scraper.requests.get") as get:
+            get.return_value = SimpleNamespace(ok=True, status_code=200, content=sitemap, headers={"ETag": '"v1"'})
+            assert scraper.fetch_urls_from_sitemap() == expected
+
+            get.return_value = SimpleNamespace(ok=False, status_code=304, content=b"", headers={})
+            assert scraper.fetch_urls_from_sitemap() == expected
+            assert get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+            # Same bytes without conditional request support: the cached URLs are used instead of parsing again
+            get.return_value = SimpleNamespace(ok=True, status_code=200, content=sitemap, headers={})
+            with patch("pydoll_substack2md.pydoll_scraper._iter_xml_elements") as iter_xml:
+                assert scraper.fetch_urls_from_sitemap() == expected
+            iter_xml.assert_not_called()
+
+    def test_retarget_switches_substack(self, scraper, tmp_path):
+        scraper._get_existing_urls_from_files()
+
+        with patch.object(scraper, "get_all_post_urls", return_value=["https://other.substack.com/p/a"]):
+            scraper.retarget("https://other.substack.com")
+
+        assert scraper.base_substack_url == "https://other.substack.com/"
+        assert scraper.md_save_dir == f"{tmp_path / 'md'}/other"
+        assert scraper.html_save_dir == f"{tmp_path / 'html'}/other"
+        assert os.path.isdir(scraper.images_dir)
+        assert scraper.post_urls == ["https://other.substack.com/p/a"]
+        assert scraper._existing_slugs is None
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_download_image_skips_known_files(self, scraper):
+        async def fake_download(url, path):
+            Path(path).write_bytes(b"png")
+
+        with patch.object(scraper, "_download_to_file", AsyncMock(side_effect=fake_download)) as download:
+            first = await scraper.download_image("https://cdn.test/chart.png", "My Post")
+            second = await scraper.download_image("https://cdn.test/chart.png", "My Post")
+
+        assert first == second and first.startswith("images/")
+        assert first.endswith("-" + hashlib.blake2b(b"https://cdn.test/chart.png", digest_size=4).hexdigest() + ".png")
+        assert Path(scraper.md_save_dir, first).read_bytes() == b"png"
+        download.assert_awaited_once()
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_download_image_reuses_files_from_earlier_runs(self, scraper):
+        url = "https://cdn.test/chart.png"
+        filename = f"My-Post-chart-{hashlib.blake2b(url.encode(), digest_size=4).hexdigest()}.png"
+        assert scraper._downloaded_images is None  # Not listed until an image is needed
+        Path(scraper.images_dir, filename).write_bytes(b"png")
+
+        with patch.object(scraper, "_download_to_file", AsyncMock()) as download:
+            assert await scraper.download_image(url, "My Post") == f"images/{filename}"
+        download.assert_not_called()
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_download_image_fetches_concurrent_duplicates_once(self, scraper):
+        async def slow_download(url, path):
+            await asyncio.sleep(0.01)
+            Path(path).write_bytes(b"png")
+
+        with patch.object(scraper, "_download_to_file", AsyncMock(side_effect=slow_download)) as download:
+            results = await asyncio.gather(
+                *[scraper.download_image("https://cdn.test/logo.png", "My Post") for _ in range(3)]
+            )
+
+        assert len(set(results)) == 1 and results[0].startswith("images/")
+        download.assert_awaited_once()
+        assert scraper._image_downloads == {}
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_download_image_filename_parts(self, scraper):
+        url, other_url = "https://cdn.test/1234.jpeg", "https://cdn.test/5678.jpeg"
+        img_hash = hashlib.blake2b(url.encode(), digest_size=4).hexdigest()
+        other_hash = hashlib.blake2b(other_url.encode(), digest_size=4).hexdigest()
+
+        with patch.object(scraper, "_download_to_file", AsyncMock()) as download:
+            dated = await scraper.download_image(url, "What's  new: Q&A!", "A chart, annotated", "Jan 5, 2024")
+            undated = await scraper.download_image(other_url, "Post", post_date="not a date")
+            # The same image under another title or alt text reuses the file already downloaded
+            renamed = await scraper.download_image(url, "Post", "New alt text")
+
+        assert dated == f"images/20240105-Whats-new-QA-A-chart-annotated-{img_hash}.jpeg"
+        assert undated == f"images/Post-{other_hash}.jpeg"
+        assert renamed == dated
+        assert download.await_count == 2
+
+    def test_absolute_url_matches_urljoin(self, scraper):
+        for src in [
+            "https://cdn.test/a.png",
+            "//cdn.test/b.png",
+            "/img/c.png?w=10",
+            "/img/../d.png",
+            "e.png",
+            "./f.png",
+        ]:
+            assert scraper._absolute_url(src) == urljoin(scraper.base_substack_url, src)
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_process_images_downloads_concurrently(self, scraper):
+        started = []
+        release = asyncio.Event()
+
+        async def fake_download(img_url, post_title, img_context="", post_date=""):
+            started.append(img_url)
+            if len(started) == 2:
+                release.set()
+            await release.wait()  # Only completes once both downloads are in flight
+            return f"images/{img_url.rsplit('/', 1)[-1]}"
+
+        html = '<p><img src="https://cdn.test/a.png"/><img src="/b.png" alt="chart"/></p>'
+        with patch.object(scraper, "download_image", fake_download):
+            result = await asyncio.wait_for(scraper.process_images_in_content(html, "Post"), timeout=1)
+
+        assert started == ["https://cdn.test/a.png", "https://test.substack.com/b.png"]
+        assert 'src="images/a.png"' in result and 'src="images/b.png"' in result
+        assert result == '<p><img src="images/a.png"/><img alt="chart" src="images/b.png"/></p>'
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_process_images_returns_image_free_html_untouched(self, scraper):
+        html = "<p>Just text<br>and a <b>bold</b> word</p>"
+        with patch.object(scraper, "download_image", AsyncMock()) as download:
+            assert await scraper.process_images_in_content(html, "Post") is html
+        download.assert_not_called()
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_process_images_updates_parsed_element_in_place(self, scraper):
+        soup = BeautifulSoup(
+            '<article><div class="body markup"><img src="https://cdn.test/a.png"/></div></article>', "lxml"
+        )
+        body = soup.select_one("div.body.markup")
+
+        with patch.object(scraper, "download_image", AsyncMock(return_value="images/a.png")):
+            result = await scraper.process_images_in_content(body, "Post")
+
+        assert result == '<div class="body markup"><img src="images/a.png"/></div>'
+        assert soup.img["src"] == "images/a.png"
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_download_to_file_retries_server_errors(self, scraper, tmp_path):
+        statuses = [503, 429, 200]
+        body = os.urandom(200 * 1024)  # Several chunks
+
+        async def handler(request):
+            status = statuses.pop(0)
+            return web.Response(status=status, body=body if status == 200 else b"")
+
+        app = web.Application()
+        app.router.add_get("/img.png", handler)
+        with patch("asyncio.sleep", AsyncMock()):
+            async with TestServer(app) as server:
+                try:
+                    await scraper._download_to_file(str(server.make_url("/img.png")), str(tmp_path / "img.png"))
+                finally:
+                    await scraper.close_http_session()
+
+        assert statuses == []
+        assert (tmp_path / "img.png").read_bytes() == body
+        assert not (tmp_path / "img.png.part").exists()
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_download_to_file_honors_retry_after_for_all_downloads(self, scraper, tmp_path):
+        statuses = [429, 200, 200]
+
+        async def handler(request):
+            status = statuses.pop(0)
+            return web.Response(status=status, body=b"png", headers={"Retry-After": "7"} if status == 429 else {})
+
+        sleeps = []
+
+        async def record_sleep(delay):
+            sleeps.append(delay)
+
+        app = web.Application()
+        app.router.add_get("/img.png", handler)
+        with patch("asyncio.sleep", record_sleep):
+            async with TestServer(app) as server:
+                try:
+                    await scraper._download_to_file(str(server.make_url("/img.png")), str(tmp_path / "a.png"))
+                    # A download starting right after the 429 waits out the same Retry-After
+                    await scraper._download_to_file(str(server.make_url("/img.png")), str(tmp_path / "b.png"))
+                finally:
+                    await scraper.close_http_session()
+
+        assert statuses == []
+        waits = [delay for delay in sleeps if delay > 0]  # aiohttp itself yields with sleep(0)
+        assert len(waits) == 2 and all(6.5 < delay <= 7 for delay in waits)
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_scrape_single_post_with_date_writes_files(self, scraper):
+        html = """
+        <html><body>
+            <h1 class="post-title">Dated Post</h1>
+            <time datetime="2024-03-05T10:00:00.000Z">Mar 5, 2024</time>
+            <div class="available-content"><div class="body markup"><p>Body text</p></div></div>
+        </body></html>
+        """
+        assert scraper._get_existing_urls_from_files() == set()
+        with patch.object(scraper, "get_url_soup", new_callable=AsyncMock) as mock_soup:
+            mock_soup.return_value = BeautifulSoup(html, "html.parser")
+            result = await scraper.scrape_single_post_with_date("https://test.substack.com/p/dated-post")
+
+        assert result is not None
+        assert result["date_str"] == "20240305"
+        assert Path(result["file_link"]).name.startswith("20240305-dated-post")
+        assert "Body text" in Path(result["file_link"]).read_text(encoding="utf-8")
+        assert "Body text" in Path(result["html_link"]).read_text(encoding="utf-8")
+        assert "dated-post" in scraper._get_existing_urls_from_files()
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_scrape_posts_runs_all_urls(self, scraper, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        scraper.delay_range = (0, 0)
+        scraper.post_urls = [f"https://test.substack.com/p/post-{i}" for i in range(5)]
+
+        async def fake_scrape(url):
+            return {"url": url, "date_str": f"2024010{url[-1]}"}
+
+        with patch.object(scraper, "scrape_single_post_with_date", side_effect=fake_scrape) as mock_scrape:
+            with patch("pydoll_substack2md.pydoll_scraper.generate_html_file", new_callable=AsyncMock):
+                await scraper.scrape_posts(continuous=True)
+
+        assert mock_scrape.call_count == 5
+        state = json.loads(Path(scraper.md_save_dir, ".scraping_state.json").read_text())
+        assert state["latest_post_date"] == "20240104"
+        assert len(state["scraped_urls"]) == 5
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_scrape_single_post_releases_soup(self, scraper):
+        soup = BeautifulSoup(
+            '<h1 class="post-title">Title</h1><time datetime="2024-03-01">Mar 1, 2024</time>'
+            '<div class="available-content"><p>Body</p></div>',
+            "lxml",
+        )
+        with (
+            patch.object(scraper, "get_url_soup", AsyncMock(return_value=soup)),
+            patch.object(scraper, "_extract_date", wraps=scraper._extract_date) as extract_date,
+        ):
+            result = await scraper.scrape_single_post_with_date("https://test.substack.com/p/title")
+
+        assert result["date_str"] == "20240301"
+        # The byline date is looked up once and used for both the post data and the filename
+        extract_date.assert_called_once()
+        assert "Body" in Path(result["file_link"]).read_text(encoding="utf-8")
+        assert soup.decomposed
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_extract_post_data_serializes_content_off_the_event_loop(self, scraper):
+        soup = BeautifulSoup(
+            '<article><h1 class="post-title">Title</h1>'
+            '<div class="available-content"><div class="body markup"><p>Hi</p><img src="/a.png"/></div></div>'
+            "</article>",
+            "lxml",
+        )
+        converted = []
+        serialized_in = []
+        decode = Tag.decode
+
+        def record_decode(self, *args, **kwargs):
+            serialized_in.append(threading.current_thread())
+            return decode(self, *args, **kwargs)
+
+        with (
+            patch.object(scraper, "download_image", AsyncMock(return_value="images/a.png")),
+            patch.object(scraper, "html_to_md", lambda html: converted.append(html) or "md"),
+            patch.object(Tag, "decode", record_decode),
+        ):
+            title, _, _, _, md_content = await scraper.extract_post_data(soup, "https://test.substack.com/p/title")
+
+        assert title == "Title" and md_content.endswith("md")
+        assert converted == ['<div class="body markup"><p>Hi</p><img src="images/a.png"/></div>']
+        assert serialized_in and threading.main_thread() not in serialized_in
+
+    def test_extract_date(self, scraper):
+        byline = (
+            '<div class="byline-wrapper"><div class="color-pub-secondary-text-hover">'
+            "<div>Jane Doe ∙ Mar 5, 2024 ∙ Paid</div></div></div>"
+        )
+        cases = {
+            byline: "Mar 5, 2024",
+            '<time datetime="2024-03-05T10:00:00.000Z">Mar 5</time>': "2024-03-05T10:00:00.000Z",
+            '<div class="post-date">Edited · 12.03.2024</div>': "12.03.2024",
+            '<div class="post-meta"><span>Jane Doe</span></div>': "Date not found",
+        }
+        for html, expected in cases.items():
+            assert scraper._extract_date(BeautifulSoup(html, "lxml")) == expected
+
+    def test_extract_date_follows_selector_priority(self, scraper):
+        # The <time> comes later in the page, but its selector ranks above the generic date span's
+        soup = BeautifulSoup(
+            '<span class="date-label">Jan 1, 2020</span><article><time datetime="2024-03-05">Mar 5</time></article>',
+            "lxml",
+        )
+        with patch.object(BeautifulSoup, "select_one") as select_one:
+            assert scraper._extract_date(soup) == "2024-03-05"
+        select_one.assert_not_called()
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_scrape_posts_bounds_workers_and_survives_errors(self, scraper, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        scraper.delay_range = (0, 0)
+        scraper.max_concurrent = 2
+        scraper.post_urls = [f"https://test.substack.com/p/post-{i}" for i in range(6)]
+        in_flight = peak = 0
+
+        async def fake_scrape(url):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if url.endswith("-1"):
+                raise RuntimeError("boom")
+            return {"url": url, "date_str": "20240101"}
+
+        with patch.object(scraper, "scrape_single_post_with_date", side_effect=fake_scrape) as mock_scrape:
+            with patch.object(scraper, "save_essays_data_to_json", new_callable=AsyncMock) as save:
+                with patch("pydoll_substack2md.pydoll_scraper.generate_html_file", new_callable=AsyncMock):
+                    await scraper.scrape_posts()
+
+        assert mock_scrape.call_count == 6
+        assert peak == 2
+        assert len(save.call_args.args[0]) == 5
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_scrape_posts_spaces_requests_across_workers(self, scraper, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        scraper.delay_range = (0.05, 0.05)
+        scraper.max_concurrent = 3
+        scraper.post_urls = [f"https://test.substack.com/p/post-{i}" for i in range(3)]
+        starts = []
+
+        async def fake_scrape(url):
+            starts.append(time.monotonic())
+
+        begin = time.monotonic()
+        with patch.object(scraper, "scrape_single_post_with_date", side_effect=fake_scrape):
+            with patch("pydoll_substack2md.pydoll_scraper.generate_html_file", new_callable=AsyncMock):
+                await scraper.scrape_posts()
+
+        # The first request goes out immediately, the rest are spaced by the delay even with idle workers
+        assert starts[0] - begin < 0.04
+        assert all(later - earlier >= 0.045 for earlier, later in itertools.pairwise(starts))
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_scrape_posts_saves_finished_posts_when_interrupted(self, scraper, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        scraper.delay_range = (0, 0)
+        scraper.max_concurrent = 1
+        scraper.post_urls = [f"https://test.substack.com/p/post-{i}" for i in range(4)]
+        Path(scraper.md_save_dir, ".scraping_state.json").write_text(
+            json.dumps({"latest_post_date": "20230101", "latest_post_url": "https://test.substack.com/p/old"})
+        )
+
+        async def fake_scrape(url):
+            if url.endswith("-2"):
+                raise asyncio.CancelledError
+            return {"url": url, "date_str": f"2024010{url[-1]}"}
+
+        with patch.object(scraper, "scrape_single_post_with_date", side_effect=fake_scrape):
+            with patch("pydoll_substack2md.pydoll_scraper.generate_html_file", new_callable=AsyncMock) as generate:
+                with pytest.raises(asyncio.CancelledError):
+                    await scraper.scrape_posts(continuous=True)
+
+        saved = json.loads(Path("data", f"{scraper.writer_name}.json").read_text(encoding="utf-8"))
+        assert [post["url"] for post in saved] == scraper.post_urls[:2]
+        state = json.loads(Path(scraper.md_save_dir, ".scraping_state.json").read_text())
+        assert state["latest_post_date"] == "20230101"
+        assert sorted(state["scraped_urls"]) == scraper.post_urls[:2]
+        generate.assert_not_called()
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_scrape_posts_keeps_spacing_between_calls(self, scraper, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        scraper.delay_range = (0.05, 0.05)
+        starts = []
+
+        async def fake_scrape(url):
+            starts.append(time.monotonic())
+
+        with patch.object(scraper, "scrape_single_post_with_date", side_effect=fake_scrape):
+            with patch("pydoll_substack2md.pydoll_scraper.generate_html_file", new_callable=AsyncMock):
+                for i in range(2):
+                    scraper.post_urls = [f"https://test.substack.com/p/post-{i}"]
+                    await scraper.scrape_posts()
+
+        assert starts[1] - starts[0] >= 0.045
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_scrape_posts_skips_existing_files(self, scraper, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        scraper.delay_range = (0, 0)
+        scraper.post_urls = [f"https://test.substack.com/p/post-{i}" for i in range(4)]
+        Path(scraper.md_save_dir, "20240101-post-1.md").write_text("x", encoding="utf-8")
+        Path(scraper.md_save_dir, "post-2.md").write_text("x", encoding="utf-8")
+
+        with patch.object(scraper, "scrape_single_post_with_date", new_callable=AsyncMock) as mock_scrape:
+            mock_scrape.return_value = None
+            with patch("pydoll_substack2md.pydoll_scraper.generate_html_file", new_callable=AsyncMock):
+                await scraper.scrape_posts()
+
+        scraped = sorted(call.args[0] for call in mock_scrape.call_args_list)
+        assert scraped == ["https://test.substack.com/p/post-0", "https://test.substack.com/p/post-3"]
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_save_essays_data_to_json_dedupes_by_url(self, scraper, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        await scraper.save_essays_data_to_json([{"url": "https://test.substack.com/p/a", "like_count": "1"}])
+        await scraper.save_essays_data_to_json(
+            [
+                {"url": "https://test.substack.com/p/a", "like_count": "2"},
+                {"url": "https://test.substack.com/p/b", "like_count": "0"},
+                {"url": "https://test.substack.com/p/b", "like_count": "5"},
+            ]
+        )
+
+        saved = json.loads((tmp_path / "data" / "test.json").read_text(encoding="utf-8"))
+        assert [item["url"] for item in saved] == ["https://test.substack.com/p/a", "https://test.substack.com/p/b"]
+        assert [item["like_count"] for item in saved] == ["1", "0"]
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_save_essays_data_to_json_serializes_off_the_event_loop(self, scraper, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        threads = []
+
+        def recording_dump(data):
+            threads.append(threading.current_thread())
+            return _dump_json_bytes(data)
+
+        with patch("pydoll_substack2md.pydoll_scraper._dump_json_bytes", recording_dump):
+            await scraper.save_essays_data_to_json([{"url": "https://test.substack.com/p/a"}])
+
+        assert threads and threads[0] is not threading.main_thread()
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_scraping_state_round_trip(self, scraper):
+        state = {"last_scraped": "2024-01-01T00:00:00", "total_posts": 3}
+        await scraper.save_scraping_state(state)
+        assert scraper.load_scraping_state() == state
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_save_to_file_keeps_existing_file(self, scraper, tmp_path):
+        path = tmp_path / "post.md"
+        await scraper.save_to_file(str(path), "first")
+        await scraper.save_to_file(str(path), "second")
+        assert path.read_text(encoding="utf-8") == "first"
+
 
 class TestPydollSubstackScraper:
     """Test the PydollSubstackScraper implementation."""
 
     @pytest.fixture  # type: ignore
-    def scraper(self, tmp_path: Path) -> BaseSubstackScraper:
+    def scraper(self, tmp_path: Path, monkeypatch) -> BaseSubstackScraper:
+        # Keep saved login cookies out of the real config directory
+        monkeypatch.setattr("pydoll_substack2md.pydoll_scraper.SESSION_COOKIE_FILE", str(tmp_path / "cookies.json"))
         return PydollSubstackScraper(
             "https://test.substack.com", str(tmp_path / "md"), str(tmp_path / "html"), headless=True
         )
@@ -113,12 +743,37 @@ class TestPydollSubstackScraper:
             assert scraper.browser == mock_browser
             assert scraper.tab == mock_tab
             mock_tab.enable_network_events.assert_called_once()
+            mock_tab.enable_auto_solve_cloudflare_captcha.assert_called_once()
 
-    # Resource blocking test removed - feature temporarily disabled
-    # @pytest.mark.asyncio  # type: ignore
-    # async def test_setup_resource_blocking(self, scraper):
-    #     \"\"\"Test resource blocking setup.\"\"\"
-    #     pass
+    @pytest.mark.asyncio  # type: ignore
+    async def test_initialize_browser_uses_profile_dir(self, scraper, tmp_path):
+        with patch("pydoll_substack2md.pydoll_scraper.Chrome") as MockChrome:
+            MockChrome.return_value = AsyncMock()
+            await scraper.initialize_browser()
+            assert not any(
+                arg.startswith("--user-data-dir") for arg in MockChrome.call_args.kwargs["options"].arguments
+            )
+
+            scraper.profile_dir = str(tmp_path / "profile")
+            await scraper.initialize_browser()
+
+        assert f"--user-data-dir={tmp_path / 'profile'}" in MockChrome.call_args.kwargs["options"].arguments
+        assert (tmp_path / "profile").is_dir()
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_prepare_tab_blocks_resources_unless_disabled(self, scraper):
+        tab = AsyncMock()
+        await scraper._prepare_tab(tab)
+
+        command = tab._execute_command.call_args.args[0]
+        assert command["method"] == "Network.setBlockedURLs"
+        assert "*.woff2" in command["params"]["urls"]
+
+        scraper.block_resources = False
+        tab = AsyncMock()
+        await scraper._prepare_tab(tab)
+        tab._execute_command.assert_not_called()
+        tab.enable_network_events.assert_awaited_once()
 
     @pytest.mark.asyncio  # type: ignore  # type: ignore
     async def test_login_without_credentials(self, scraper):
@@ -128,6 +783,627 @@ class TestPydollSubstackScraper:
             await scraper.login()
             assert not scraper.is_logged_in
 
+    @pytest.mark.asyncio  # type: ignore
+    async def test_login_verifies_with_one_short_probe(self, scraper):
+        scraper.tab = AsyncMock()
+        scraper.tab.current_url = asyncio.sleep(0, result="https://substack.com/sign-in?next=home")
+
+        with (
+            patch("pydoll_substack2md.pydoll_scraper.SUBSTACK_EMAIL", "me@test"),
+            patch("pydoll_substack2md.pydoll_scraper.SUBSTACK_PASSWORD", "secret"),
+            patch.object(scraper, "perform_login_on_page", AsyncMock()),
+            patch.object(scraper, "_wait_for_js", AsyncMock(return_value=True)),
+            patch.object(scraper, "_find_first", AsyncMock(return_value=("user_menu", object()))) as find_first,
+            patch.object(scraper, "_evaluate", AsyncMock(return_value=None)),
+            patch.object(scraper, "save_session_cookies", AsyncMock()),
+        ):
+            begin = time.monotonic()
+            await scraper.login()
+
+        assert scraper.is_logged_in
+        assert time.monotonic() - begin < 1
+        find_first.assert_awaited_once()
+        assert find_first.call_args.kwargs["timeout"] < 1
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_login_raises_on_error_container(self, scraper):
+        page = BeautifulSoup('<div id="error-container">Invalid email or password</div>', "lxml")
+
+        async def evaluate(script):
+            # Stand-in for the browser: answer the error lookup from a page showing the error container
+            assert "getElementById('error-container')" in script
+            element = page.find(id="error-container")
+            return element.get_text() if element is not None else None
+
+        scraper.tab = AsyncMock()
+        scraper.tab.current_url = asyncio.sleep(0, result="https://substack.com/sign-in?next=home")
+        with (
+            patch("pydoll_substack2md.pydoll_scraper.SUBSTACK_EMAIL", "me@test"),
+            patch("pydoll_substack2md.pydoll_scraper.SUBSTACK_PASSWORD", "secret"),
+            patch.object(scraper, "perform_login_on_page", AsyncMock()),
+            patch.object(scraper, "_wait_for_js", AsyncMock(return_value=True)),
+            patch.object(scraper, "_find_first", AsyncMock(return_value=(None, None))),
+            patch.object(scraper, "_evaluate", evaluate),
+        ):
+            with pytest.raises(Exception, match="Login failed: Invalid email or password"):
+                await scraper.login()
+
+        assert not scraper.is_logged_in
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_find_first_uses_single_evaluation(self, scraper):
+        scraper.tab = AsyncMock()
+        scraper.tab.execute_script.return_value = {"result": {"result": {"value": "name_email"}}}
+        mock_element = AsyncMock()
+        scraper.tab.query.return_value = mock_element
+
+        name, element = await scraper._find_first(
+            [("type_email", "input[type='email']", ""), ("name_email", "input[name='email']", "")]
+        )
+
+        assert (name, element) == ("name_email", mock_element)
+        scraper.tab.execute_script.assert_called_once()
+        scraper.tab.query.assert_called_once_with("[data-substack2md-match='name_email']", raise_exc=False)
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_find_first_survives_navigation(self, scraper):
+        scraper.tab = AsyncMock()
+        scraper.tab.execute_script.side_effect = [
+            RuntimeError("Execution context was destroyed"),
+            {"result": {"result": {"value": "user_menu"}}},
+        ]
+        mock_element = AsyncMock()
+        scraper.tab.query.return_value = mock_element
+
+        with patch("pydoll_substack2md.pydoll_scraper._PROBE_POLL_INTERVAL", 0):
+            assert await scraper._find_first([("user_menu", ".user-menu", "")], timeout=1) == (
+                "user_menu",
+                mock_element,
+            )
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_find_login_form_survives_navigation(self, scraper):
+        scraper.tab = AsyncMock()
+        scraper.tab.execute_script.side_effect = [
+            RuntimeError("Execution context was destroyed"),
+            {"result": {"result": {"value": "email,submit"}}},
+            {"result": {"result": {"value": "email,submit"}}},
+        ]
+        email, submit = AsyncMock(), AsyncMock()
+        scraper.tab.query.side_effect = [RuntimeError("Execution context was destroyed"), email, submit]
+
+        with patch("pydoll_substack2md.pydoll_scraper._PROBE_POLL_INTERVAL", 0):
+            assert await scraper._find_login_form(timeout=1) == {"email": email, "submit": submit}
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_find_first_no_match(self, scraper):
+        scraper.tab = AsyncMock()
+        scraper.tab.execute_script.return_value = {"result": {"result": {"type": "object", "subtype": "null"}}}
+
+        assert await scraper._find_first([("user_menu", ".user-menu", "")], timeout=0) == (None, None)
+        scraper.tab.query.assert_not_called()
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_wait_for_content_polls_one_script(self, scraper):
+        scraper.tab = AsyncMock()
+        values = iter([None, "article"])
+        scraper.tab.execute_script.side_effect = lambda script: {"result": {"result": {"value": next(values)}}}
+
+        assert await scraper._wait_for_content(timeout=1) == "article"
+        assert scraper.tab.execute_script.call_count == 2
+        assert len({call.args[0] for call in scraper.tab.execute_script.call_args_list}) == 1
+        scraper.tab.query.assert_not_called()
+
+        scraper.tab.execute_script.side_effect = None
+        scraper.tab.execute_script.return_value = {"result": {"result": {"type": "object", "subtype": "null"}}}
+        assert await scraper._wait_for_content(timeout=0) is None
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_find_login_form_single_walk(self, scraper):
+        scraper.tab = AsyncMock()
+        scraper.tab.execute_script.return_value = {"result": {"result": {"value": "email,submit"}}}
+        scraper.tab.query.side_effect = lambda selector, raise_exc=False: selector
+
+        form = await scraper._find_login_form()
+
+        assert form == {
+            "email": "[data-substack2md-role='email']",
+            "submit": "[data-substack2md-role='submit']",
+        }
+        scraper.tab.execute_script.assert_called_once()
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_handle_sign_in_button_single_walk(self, scraper):
+        scraper.tab = AsyncMock()
+        scraper.tab.execute_script.return_value = {"result": {"result": {"value": "sign_in"}}}
+        button = AsyncMock()
+        scraper.tab.query.return_value = button
+
+        login = AsyncMock()
+        with patch.object(scraper, "_wait_for_js", AsyncMock()), patch.object(scraper, "perform_login_on_page", login):
+            assert await scraper.handle_sign_in_button()
+
+        scraper.tab.execute_script.assert_called_once()
+        scraper.tab.find.assert_not_called()
+        button.click.assert_awaited_once()
+        login.assert_awaited_once()
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_wait_for_js_returns_once_condition_holds(self, scraper):
+        scraper.tab = AsyncMock()
+        scraper.tab.execute_script.side_effect = [
+            {"result": {"result": {"value": False}}},
+            RuntimeError("Execution context was destroyed"),
+            {"result": {"result": {"value": True}}},
+        ]
+
+        assert await scraper._wait_for_js("document.readyState === 'complete'", timeout=1)
+        assert scraper.tab.execute_script.call_count == 3
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_wait_for_js_times_out(self, scraper):
+        scraper.tab = AsyncMock()
+        scraper.tab.execute_script.return_value = {"result": {"result": {"value": False}}}
+
+        assert not await scraper._wait_for_js("false", timeout=0.1)
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_manual_login_detected_without_enter(self, scraper):
+        scraper.tab = AsyncMock()
+        find_first = AsyncMock(return_value=("reader_nav", object()))
+        unanswered = asyncio.get_running_loop().create_future()
+
+        with (
+            patch.object(scraper, "_go_to", AsyncMock()),
+            patch.object(scraper, "_wait_for_js", AsyncMock()) as wait_for_js,
+            patch.object(scraper, "_wait_for_login_indicator", AsyncMock(return_value="reader_nav")),
+            patch.object(scraper, "_find_first", find_first),
+            patch("pydoll_substack2md.pydoll_scraper._prompt_in_background", return_value=unanswered),
+            patch("asyncio.sleep", AsyncMock()) as sleep,
+        ):
+            await scraper.perform_manual_login()
+
+        assert scraper.is_logged_in
+        assert unanswered.cancelled()
+        find_first.assert_not_called()
+        wait_for_js.assert_awaited_once()
+        sleep.assert_not_called()
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_manual_login_enter_checks_indicators_in_one_probe(self, scraper):
+        scraper.tab = AsyncMock()
+        find_first = AsyncMock(return_value=("reader_nav", object()))
+        answered = asyncio.get_running_loop().create_future()
+        answered.set_result("")
+
+        async def never_detected(timeout):
+            await asyncio.Event().wait()
+
+        with (
+            patch.object(scraper, "_go_to", AsyncMock()),
+            patch.object(scraper, "_wait_for_js", AsyncMock()),
+            patch.object(scraper, "_wait_for_login_indicator", never_detected),
+            patch.object(scraper, "_find_first", find_first),
+            patch("pydoll_substack2md.pydoll_scraper._prompt_in_background", return_value=answered),
+        ):
+            await scraper.perform_manual_login()
+
+        assert scraper.is_logged_in
+        find_first.assert_awaited_once()
+        assert len(find_first.call_args.args[0]) == 7
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_wait_for_login_indicator_survives_navigation(self, scraper):
+        class FakeTab:
+            urls = iter(["https://substack.com/sign-in", "https://substack.com/home", "https://substack.com/home"])
+
+            @property
+            async def current_url(self):
+                return next(self.urls)
+
+        scraper.tab = FakeTab()
+        results = [RuntimeError("Execution context was destroyed"), ("home_title", object())]
+
+        with (
+            patch.object(scraper, "_find_first", AsyncMock(side_effect=results)) as find_first,
+            patch("pydoll_substack2md.pydoll_scraper._MANUAL_LOGIN_POLL_INTERVAL", 0),
+        ):
+            assert await scraper._wait_for_login_indicator(timeout=1) == "home_title"
+            assert find_first.await_count == 2
+
+            find_first.side_effect = None
+            find_first.return_value = (None, None)
+            scraper.tab.urls = itertools.repeat("https://substack.com/home")
+            assert await scraper._wait_for_login_indicator(timeout=0.05) is None
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_wait_for_stable_content(self, scraper):
+        scraper.tab = AsyncMock()
+        sizes = [-1, 100, 250, 250]
+        scraper.tab.execute_script.side_effect = [{"result": {"result": {"value": size}}} for size in sizes]
+
+        with patch("pydoll_substack2md.pydoll_scraper._STABILITY_POLL_INTERVAL", 0):
+            assert await scraper._wait_for_stable_content(timeout=1)
+            assert scraper.tab.execute_script.call_count == len(sizes)
+
+            growing = iter(range(1, 10**6))
+            scraper.tab.execute_script.side_effect = lambda script: {"result": {"result": {"value": next(growing)}}}
+            assert not await scraper._wait_for_stable_content(timeout=0.1)
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_check_paywall_after_login_single_query(self, scraper):
+        scraper.tab = AsyncMock()
+        scraper.tab.query.return_value = None
+
+        with patch.object(scraper, "check_paywall_via_analytics", AsyncMock(return_value=False)):
+            assert not await scraper.check_paywall_after_login()
+        scraper.tab.query.assert_called_once_with(
+            "[data-testid='paywall'], .paywall, h2.paywall-title", raise_exc=False
+        )
+
+        scraper.tab.query.return_value = AsyncMock()
+        with patch.object(scraper, "check_paywall_via_analytics", AsyncMock(return_value=False)):
+            assert await scraper.check_paywall_after_login()
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_handle_paywall_trusts_analytics_state(self, scraper):
+        scraper.tab = AsyncMock()
+
+        with patch("pydoll_substack2md.pydoll_scraper.SUBSTACK_EMAIL", ""):
+            with patch.object(scraper, "_analytics_state", AsyncMock(return_value=True)):
+                assert await scraper.handle_paywall("https://test.substack.com/p/post")
+            with patch.object(scraper, "_analytics_state", AsyncMock(return_value=False)):
+                assert not await scraper.handle_paywall("https://test.substack.com/p/post")
+            scraper.tab.query.assert_not_called()
+            # Without credentials the post isn't remembered: a run that can log in should still fetch it
+            assert not scraper.is_known_paywalled("https://test.substack.com/p/post")
+
+            scraper.tab.query.return_value = None
+            with patch.object(scraper, "_analytics_state", AsyncMock(return_value=None)):
+                assert await scraper.handle_paywall("https://test.substack.com/p/post")
+            scraper.tab.query.assert_called_once()
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_ensure_browser_initialized_skips_liveness_probe(self, scraper):
+        scraper.browser = AsyncMock()
+        scraper.tab = AsyncMock()
+
+        with patch.object(scraper, "reinitialize_browser", AsyncMock()) as reinit:
+            await scraper.ensure_browser_initialized()
+            reinit.assert_not_called()
+            assert scraper.tab.mock_calls == []
+
+            scraper.tab = None
+            await scraper.ensure_browser_initialized()
+            reinit.assert_awaited_once()
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_first_hit_returns_first_truthy_and_cancels_rest(self, scraper):
+        slow_cancelled = asyncio.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                slow_cancelled.set()
+                raise
+
+        async def failing():
+            raise RuntimeError("boom")
+
+        async def miss():
+            return None
+
+        async def hit():
+            return "element"
+
+        result = await asyncio.wait_for(
+            scraper._first_hit([("slow", slow), ("failing", failing), ("miss", miss), ("hit", hit)]), timeout=1
+        )
+
+        assert result == ("hit", "element")
+        await asyncio.sleep(0)
+        assert slow_cancelled.is_set()
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_first_hit_no_match(self, scraper):
+        async def miss():
+            return None
+
+        assert await scraper._first_hit([("a", miss), ("b", miss)]) == (None, None)
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_page_source_fetched_once_per_url(self, scraper):
+        class FakeTab:
+            url = "https://test.substack.com/p/one"
+            fetches = 0
+
+            @property
+            async def current_url(self):
+                return self.url
+
+            @property
+            async def page_source(self):
+                self.fetches += 1
+                return '<script>{"is_subscribed":false}</script>'
+
+            async def go_to(self, url):
+                self.url = url
+
+        scraper.tab = FakeTab()
+
+        assert not await scraper.check_login_status_via_analytics()
+        assert await scraper.check_paywall_via_analytics()
+        assert scraper.tab.fetches == 1
+
+        await scraper._go_to("https://test.substack.com/p/two")
+        await scraper.check_paywall_via_analytics()
+        assert scraper.tab.fetches == 2
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_current_url_cached_until_invalidated(self, scraper):
+        class FakeTab:
+            url_reads = 0
+
+            @property
+            async def current_url(self):
+                self.url_reads += 1
+                return "https://test.substack.com/p/redirected"
+
+            async def go_to(self, url):
+                pass
+
+        scraper.tab = FakeTab()
+
+        await scraper._go_to("https://test.substack.com/p/post")
+        assert await scraper._current_page_url() == "https://test.substack.com/p/post"
+        assert scraper.tab.url_reads == 0
+
+        scraper._invalidate_page_cache()
+        assert await scraper._current_page_url() == "https://test.substack.com/p/redirected"
+        assert await scraper._current_page_url() == "https://test.substack.com/p/redirected"
+        assert scraper.tab.url_reads == 1
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_analytics_flags_parsed_once_per_source(self, scraper):
+        source = b'{"is_subscribed":false,"is_logged_in":true,"nested":{"is_subscribed":true}}'
+
+        with patch.object(scraper, "_get_page_source_cached", AsyncMock(return_value=source)):
+            flags = await scraper._analytics_flags()
+            assert await scraper._analytics_flags() is flags
+
+        assert flags == {"is_subscribed": False, "is_logged_in": True}
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_analytics_state(self, scraper):
+        sources = {
+            b'{"is_subscribed":true}': True,
+            b'{"is_subscribed":false}': False,
+            b"<html>no analytics</html>": None,
+        }
+        for source, expected in sources.items():
+            with patch.object(scraper, "_get_page_source_cached", AsyncMock(return_value=source)):
+                assert await scraper._analytics_state() is expected
+                assert await scraper.check_login_status_via_analytics() is (expected is True)
+                assert await scraper.check_paywall_via_analytics() is (expected is False)
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_get_url_soup_reuses_cached_source_with_post_body(self, scraper):
+        url = "https://test.substack.com/p/cached"
+
+        class FakeTab:
+            fetches = 0
+
+            @property
+            async def current_url(self):
+                return url
+
+            @property
+            async def page_source(self):
+                self.fetches += 1
+                return '<html><body><div class="body markup"><p>Héllo ✓</p></div></body></html>'
+
+            async def go_to(self, target):
+                pass
+
+            async def query(self, selector, timeout=0, raise_exc=True):
+                return None
+
+        async def check_paywall(target):
+            await scraper._get_page_source_cached()
+            return True
+
+        scraper.tab = FakeTab()
+        scraper.is_logged_in = True
+        with (
+            patch.object(scraper, "ensure_browser_initialized", AsyncMock()),
+            patch.object(scraper, "_wait_for_js", AsyncMock()),
+            patch.object(scraper, "_wait_for_stable_content", AsyncMock()),
+            patch.object(scraper, "handle_paywall", check_paywall),
+            patch.object(scraper, "_wait_for_content", AsyncMock(return_value="div.body.markup")),
+            patch.object(scraper, "_first_hit", AsyncMock(return_value=(None, None))),
+            patch("asyncio.sleep", AsyncMock()),
+        ):
+            soup = await scraper.get_url_soup(url)
+
+        assert soup.find("p").text == "Héllo ✓"
+        assert scraper.tab.fetches == 1
+        assert not scraper._page_source_cache and scraper._analytics_flags_cache is None
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_get_url_soup_retry_releases_page_source(self, scraper):
+        url = "https://test.substack.com/p/retry"
+        scraper.tab = AsyncMock()
+        scraper.tab.go_to.side_effect = [OSError("connection lost"), None]
+        scraper.tab.page_source = asyncio.sleep(0, result='<html><body><div class="body markup">Hi</div></body></html>')
+
+        with (
+            patch.object(scraper, "ensure_browser_initialized", AsyncMock()),
+            patch.object(scraper, "reinitialize_browser", AsyncMock()),
+            patch.object(scraper, "_wait_for_js", AsyncMock()),
+        ):
+            soup = await scraper.get_url_soup(url)
+
+        assert soup.find("div").text == "Hi"
+        assert not scraper._page_source_cache
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_get_url_soup_skips_paywall_before_content_wait(self, scraper):
+        url = "https://test.substack.com/p/premium"
+        scraper.tab = AsyncMock()
+        scraper.tab.query.return_value = AsyncMock()
+        scraper.is_logged_in = False
+        with (
+            patch("pydoll_substack2md.pydoll_scraper.SUBSTACK_EMAIL", ""),
+            patch.object(scraper, "ensure_browser_initialized", AsyncMock()),
+            patch.object(scraper, "_wait_for_js", AsyncMock(return_value=True)) as wait_for_js,
+            patch.object(scraper, "handle_paywall", AsyncMock()) as handle_paywall,
+            patch.object(scraper, "_wait_for_content", AsyncMock()) as wait_for_content,
+        ):
+            assert await scraper.get_url_soup(url) is None
+
+        assert "h2.paywall-title" in wait_for_js.call_args.args[0]
+        scraper.tab.query.assert_called_once_with(
+            "[data-testid='paywall'], .paywall, h2.paywall-title", raise_exc=False
+        )
+        handle_paywall.assert_not_called()
+        wait_for_content.assert_not_called()
+        # Not remembered, since a run with credentials may get past the paywall
+        assert not scraper.is_known_paywalled(url)
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_session_cookies_saved_and_restored(self, scraper, tmp_path):
+        cookie_file = tmp_path / "cookies.json"
+        saved = [
+            {
+                "name": "substack.sid",
+                "value": "abc",
+                "domain": ".substack.com",
+                "path": "/",
+                "expires": 2e9,
+                "size": 15,
+            },
+            {"name": "ajs_id", "value": "x", "domain": ".substack.com", "path": "/", "expires": -1, "session": True},
+        ]
+        scraper.tab = AsyncMock()
+        scraper.tab.get_cookies.return_value = saved
+
+        await scraper.save_session_cookies()
+        assert json.loads(cookie_file.read_text()) == saved
+        assert cookie_file.stat().st_mode & 0o777 == 0o600
+
+        assert await scraper.restore_session_cookies()
+        restored = scraper.tab.set_cookies.call_args.args[0]
+        assert restored[0] == {
+            "name": "substack.sid",
+            "value": "abc",
+            "domain": ".substack.com",
+            "path": "/",
+            "expires": 2e9,
+        }
+        assert "expires" not in restored[1] and "session" not in restored[1]
+
+        # Stale or discarded sessions are not restored
+        with patch("pydoll_substack2md.pydoll_scraper.time.time", return_value=time.time() + 15 * 24 * 60 * 60):
+            assert not await scraper.restore_session_cookies()
+        scraper.forget_session_cookies()
+        assert not cookie_file.exists()
+        assert not await scraper.restore_session_cookies()
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_scrape_posts_skips_login_with_saved_session(self, scraper):
+        scraper.tab = AsyncMock()
+
+        async def start_browser():
+            scraper.browser = AsyncMock()
+
+        with (
+            patch.object(scraper, "initialize_browser", side_effect=start_browser),
+            patch.object(scraper, "restore_session_cookies", AsyncMock(return_value=True)),
+            patch.object(scraper, "perform_manual_login", AsyncMock()) as manual_login,
+            patch.object(scraper, "login", AsyncMock()) as login,
+            patch.object(BaseSubstackScraper, "scrape_posts", AsyncMock()),
+        ):
+            scraper.manual_login = True
+            await scraper.scrape_posts()
+
+        assert scraper.is_logged_in
+        manual_login.assert_not_called()
+        login.assert_not_called()
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_tab_pool_views_share_saved_posts_and_images(self, scraper):
+        scraper.tab = AsyncMock()
+        scraper.browser = AsyncMock()
+        scraper.browser.new_tab.side_effect = [AsyncMock()]
+
+        pool = await scraper._open_tab_pool(2)
+        views = [pool.get_nowait() for _ in range(2)]
+        await scraper.close_http_session()
+
+        for view in views:
+            assert view._image_files() is scraper._image_files()
+            assert view._get_existing_urls_from_files() is scraper._get_existing_urls_from_files()
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_tab_pool_views_share_login_state(self, scraper):
+        scraper.tab = AsyncMock()
+        scraper.browser = AsyncMock()
+        scraper.browser.new_tab.side_effect = [AsyncMock()]
+
+        pool = await scraper._open_tab_pool(2)
+        first, second = pool.get_nowait(), pool.get_nowait()
+        await scraper.close_http_session()
+
+        first.is_logged_in = True  # e.g. one tab logged in again after the session dropped
+        first._session_restored = True
+        assert second.is_logged_in and scraper.is_logged_in
+        assert second._session_restored and scraper._session_restored
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_tab_pool_runs_posts_on_separate_tabs(self, scraper):
+        scraper.tab = AsyncMock()
+        scraper.browser = AsyncMock()
+        extra_tabs = [AsyncMock(), AsyncMock()]
+        scraper.browser.new_tab.side_effect = extra_tabs
+        used_tabs = []
+
+        async def fake_soup(view, url):
+            used_tabs.append(view.tab)
+            await asyncio.sleep(0.01)
+            return None
+
+        scraper._tab_pool = await scraper._open_tab_pool(3)
+        with patch.object(PydollSubstackScraper, "get_url_soup", fake_soup):
+            await asyncio.gather(*(scraper.scrape_single_post_with_date(f"https://t.test/p/{i}") for i in range(3)))
+        await scraper._close_tab_pool()
+
+        assert set(map(id, used_tabs)) == {id(scraper.tab), *map(id, extra_tabs)}
+        for tab in extra_tabs:
+            tab.enable_auto_solve_cloudflare_captcha.assert_awaited_once()
+            tab.close.assert_awaited_once()
+        scraper.tab.close.assert_not_called()
+        assert scraper._tab_pool is None
+        await scraper.close_http_session()
+
+    @pytest.mark.asyncio  # type: ignore
+    async def test_known_paywalled_posts_skipped_across_runs(self, scraper, tmp_path):
+        url = "https://test.substack.com/p/paid"
+        await scraper.remember_paywalled(url)
+
+        rerun = PydollSubstackScraper(
+            "https://test.substack.com", str(tmp_path / "md"), str(tmp_path / "html"), headless=True
+        )
+        assert rerun.is_known_paywalled(url)
+        assert not rerun.is_known_paywalled("https://test.substack.com/p/free")
+
+        with patch.object(rerun, "ensure_browser_initialized", AsyncMock()) as ensure:
+            assert await rerun.get_url_soup(url) is None
+            ensure.assert_not_called()
+
+        with patch("pydoll_substack2md.pydoll_scraper.time.time", return_value=time.time() + 2 * 24 * 60 * 60):
+            assert not rerun.is_known_paywalled(url)
+
     @pytest.mark.asyncio  # type: ignore  # type: ignore
     async def test_get_url_soup_success(self, scraper):
         """Test successful URL scraping."""
@@ -180,6 +1456,66 @@ class TestPydollSubstackScraper:
         mock_tab.close.assert_called_once()
 
 
+def test_iter_xml_elements_frees_processed_entries():
+    ns = "http://www.sitemaps.org/schemas/sitemap/0.9"
+    entries = "".join(
+        f"<url><loc>https://test.substack.com/p/{i}</loc><lastmod>2024</lastmod></url>" for i in range(50)
+    )
+    sitemap = f'<urlset xmlns="{ns}">{entries}</urlset>'.encode()
+
+    urls = []
+    for loc in _iter_xml_elements(sitemap, f"{{{ns}}}loc"):
+        urls.append(loc.text)
+        urlset = loc.getparent().getparent()
+
+    assert len(urlset) == 1  # Processed <url> entries are gone, not just emptied
+    assert urls == [f"https://test.substack.com/p/{i}" for i in range(50)]
+
+
+def test_parse_post_html_keeps_only_the_article():
+    page = (
+        b"<html><head><title>T</title></head><body><nav><h2>Menu</h2></nav>"
+        b'<article><h1 class="post-title">Title</h1><time datetime="2024-03-01">Mar 1</time>'
+        b'<div class="available-content"><div class="body markup"><p>Body</p></div></div></article>'
+        b'<div class="comments"><p>Comment</p></div></body></html>'
+    )
+
+    soup = _parse_post_html(page)
+    assert soup.select_one("h1.post-title").text == "Title"
+    assert soup.select_one("time[datetime]")["datetime"] == "2024-03-01"
+    assert soup.select_one("div.available-content div.body.markup").text == "Body"
+    assert soup.find("nav") is None and soup.select_one("div.comments") is None
+
+    # Pages without an <article> keep their whole body
+    soup = _parse_post_html(b'<html><body><div class="post"><h2>Title</h2><p>Body</p></div></body></html>')
+    assert soup.select_one("h2").text == "Title" and soup.find("p").text == "Body"
+
+
+@pytest.mark.asyncio  # type: ignore
+async def test_generate_html_file_embeds_saved_json(tmp_path, monkeypatch):
+    template = Path(__file__).resolve().parent.parent / "author_template.html"
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "author_template.html").write_text(template.read_text(encoding="utf-8"), encoding="utf-8")
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "test.json").write_bytes(_dump_json_bytes([{"title": "Ünïcode post", "url": "u"}]))
+
+    with patch("pydoll_substack2md.pydoll_scraper._read_json_file") as read_json:
+        await generate_html_file("test")
+    read_json.assert_not_called()
+
+    page = BeautifulSoup((tmp_path / "substack_html_pages" / "test.html").read_text(encoding="utf-8"), "lxml")
+    assert json.loads(page.select_one("#essaysData").string) == [{"title": "Ünïcode post", "url": "u"}]
+
+
+def test_md_to_html_matches_markdown_module():
+    """Reusing the Markdown instance must not leak state between documents."""
+    first = "Text with a footnote[^1].\n\n[^1]: The note."
+    second = "# Heading\n\n| a | b |\n|---|---|\n| 1 | 2 |"
+
+    for md in (first, second):
+        assert BaseSubstackScraper.md_to_html(md) == markdown.markdown(md, extensions=["extra"])
+
+
 @pytest.mark.asyncio  # type: ignore
 async def test_html_to_markdown_conversion():
     """Test the html-to-markdown conversion."""